@@ -18,12 +18,14 @@
 # You should have received a copy of the GNU General Public License along with
 # upoints.  If not, see <http://www.gnu.org/licenses/>.
 
+import pickle
+from io import BytesIO
 from operator import attrgetter
 
 from pytest import mark
 
-from upoints import point, utils
-from upoints.osm import Node, Osm, Way, etree, get_area_url
+from upoints import osm, point, utils
+from upoints.osm import Node, Nodes, Osm, Way, etree, get_area_url
 
 from tests.utils import xml_compare, xml_str_compare
 
@@ -67,6 +69,33 @@ class TestNode:
         )
         self.tagged = Node(0, 52, 0, tags={'key': 'value'})
 
+    @mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle(self, protocol):
+        restored = pickle.loads(pickle.dumps(self.tagged, protocol))
+        assert repr(restored) == repr(self.tagged)
+        assert str(restored) == str(self.tagged)
+
+    def test___dict__(self):
+        assert self.tagged.__dict__ == {
+            '_angle': 'degrees',
+            '_format_cache': None,
+            '_hash': None,
+            '_latitude': 52.0,
+            '_longitude': 0.0,
+            '_rad_latitude': 0.9075712110370514,
+            '_rad_longitude': 0.0,
+            '_sin_lat': 0.788010753606722,
+            '_cos_lat': 0.6156614753256583,
+            'ident': 0,
+            'tags': {'key': 'value'},
+            'timestamp': None,
+            '_unit_scale': 1,
+            '_units': 'metric',
+            'timezone': 0,
+            'user': None,
+            'visible': False,
+        }
+
     @mark.parametrize(
         'node, result',
         [
@@ -100,6 +129,19 @@ class TestNode:
     def test___str__(self, node, result):
         assert str(getattr(self, node)) == result
 
+    def test___str___modified(self):
+        assert str(self.tagged) == (
+            'Node 0 (52°00′00″N, 000°00′00″E) [key: value]'
+        )
+        self.tagged.tags = {'key': 'new value'}
+        assert str(self.tagged) == (
+            'Node 0 (52°00′00″N, 000°00′00″E) [key: new value]'
+        )
+        self.tagged.tags['key'] = 'edited value'
+        assert str(self.tagged) == (
+            'Node 0 (52°00′00″N, 000°00′00″E) [key: edited value]'
+        )
+
     @mark.parametrize(
         'node, result',
         [
@@ -151,11 +193,18 @@ class TestNode:
             % results
         )
 
-    def test_fetch_area_osm(self):
-        # FIXME: The following test is skipped, because the Osm object doesn't
-        # support a reliable way __repr__ method.
-        # assert Home.fetch_area_osm(3
-        pass
+    def test_fetch_area_osm(self, monkeypatch):
+        requests = []
+
+        def urlopen(request):
+            requests.append(request)
+            return open('tests/data/osm', 'rb')
+
+        monkeypatch.setattr(osm, 'urlopen', urlopen)
+        region = self.bare.fetch_area_osm(3)
+        assert requests[0].full_url == self.bare.get_area_url(3)
+        assert requests[0].get_header('User-agent') == osm.ua_string
+        assert len(region) == 4
 
 
 class TestWay:
@@ -268,6 +317,53 @@ class TestWay:
         xml_str_compare(result, etree.tostring(getattr(self, node).toosm()))
 
 
+class TestNodes:
+    def setup(self):
+        self.nodes = Nodes(
+            [
+                Node(0, 52, 0),
+                Node(1, 52, 1, True, 'jnrowe', utils.Timestamp(2008, 1, 25)),
+                Node(2, 52, 2, tags={'key': 'value'}),
+            ]
+        )
+
+    def test___repr__(self):
+        assert repr(self.nodes) == (
+            'Nodes([Node(0, 52.0, 0.0, False, None, None, {}), '
+            "Node(1, 52.0, 1.0, True, 'jnrowe', Timestamp(2008, 1, 25, 0, 0), "
+            '{}), '
+            "Node(2, 52.0, 2.0, False, None, None, {'key': 'value'})])"
+        )
+
+    def test___len__(self):
+        assert len(self.nodes) == 3
+
+    def test___iter__(self):
+        assert [repr(x) for x in self.nodes] == [
+            repr(self.nodes[i]) for i in range(len(self.nodes))
+        ]
+
+    @mark.parametrize(
+        'index, result',
+        [
+            (0, 'Node 0 (52°00′00″N, 000°00′00″E)'),
+            (
+                -2,
+                'Node 1 (52°00′00″N, 001°00′00″E) [visible, user: jnrowe, '
+                'timestamp: 2008-01-25T00:00:00+00:00]',
+            ),
+            (2, 'Node 2 (52°00′00″N, 002°00′00″E) [key: value]'),
+        ],
+    )
+    def test___getitem__(self, index, result):
+        assert str(self.nodes[index]) == result
+
+    def test___getitem___slice(self):
+        assert [x.ident for x in self.nodes[1:]] == [1, 2]
+        assert [x.ident for x in self.nodes[::-2]] == [2, 0]
+        assert self.nodes[3:] == []
+
+
 class TestOsm:
     def setup(self):
         with open('tests/data/osm') as f:
@@ -294,3 +390,80 @@ class TestOsm:
         osm_xml = etree.parse('tests/data/osm')
         for e1, e2 in zip(export.getiterator(), osm_xml.getiterator()):
             xml_compare(e1, e2)
+
+    @mark.parametrize(
+        'filter_ways, result',
+        [
+            (False, [0, 1, 2, 3]),
+            (True, [0, 1, 2]),
+        ],
+    )
+    def test_import_locations_filter_ways(self, filter_ways, result):
+        with open('tests/data/osm') as f:
+            data = f.readlines()
+        data.insert(
+            data.index('</osm>\n'), '  <node id="3" lat="52.0" lon="0.0" />\n'
+        )
+        region = Osm()
+        region.import_locations(data, filter_ways)
+        assert [x.ident for x in region if isinstance(x, Node)] == result
+        assert [x.ident for x in region if isinstance(x, Way)] == [0]
+
+    def test_import_locations_filter_ways_file(self):
+        region = Osm()
+        with open('tests/data/osm') as f:
+            region.import_locations(f, filter_ways=True)
+        assert len(region) == 4
+
+    def test_export_osm_file_stream(self):
+        output = BytesIO()
+        self.region.export_osm_file(output)
+        export = etree.fromstring(output.getvalue())
+        osm_xml = etree.parse('tests/data/osm').getroot()
+        for e1, e2 in zip(export.iter(), osm_xml.iter()):
+            xml_compare(e1, e2)
+
+    def test_import_locations_compact(self):
+        region = Osm()
+        with open('tests/data/osm') as f:
+            region.import_locations(f, compact=True)
+        assert len(region) == 1
+        assert [str(x) for x in region.nodes] == [
+            str(x) for x in self.region if isinstance(x, Node)
+        ]
+        export = region.export_osm_file()
+        osm_xml = etree.parse('tests/data/osm')
+        for e1, e2 in zip(export.iter(), osm_xml.iter()):
+            xml_compare(e1, e2)
+
+    def test_import_locations_compact_reset(self):
+        region = Osm()
+        with open('tests/data/osm') as f:
+            region.import_locations(f, compact=True)
+        del region[:]
+        with open('tests/data/osm') as f:
+            region.import_locations(f)
+        assert region.nodes is None
+        export = region.export_osm_file()
+        assert [elem.tag for elem in export.getroot().iterchildren()] == [
+            'node',
+            'node',
+            'node',
+            'way',
+        ]
+
+    def test_import_locations_ways(self):
+        assert [str(x) for x in self.region if isinstance(x, Way)] == [
+            'Way 0 (nodes: 0, 1, 2) [visible, timestamp: '
+            '2008-01-25T13:00:00+00:00, highway: primary, ref: My Way]'
+        ]
+
+    def test_import_locations_hidden(self):
+        region = Osm(
+            [
+                '<osm version="0.5">',
+                '<node id="0" lat="52.0" lon="0.0" visible="false" />',
+                '</osm>',
+            ]
+        )
+        assert region[0].visible is False
@@ -20,6 +20,7 @@
 
 import datetime
 import math
+import pickle
 
 from pytest import approx, mark, raises
 
@@ -55,10 +56,72 @@ class TestPoint:
             '_longitude': -0.221,
             '_rad_latitude': 0.9078330104248505,
             '_rad_longitude': -0.0038571776469074684,
+            '_sin_lat': 0.7881719063975099,
+            '_cos_lat': 0.6154551534967555,
+            '_hash': None,
+            '_format_cache': None,
+            '_unit_scale': 1,
+            '_units': 'metric',
             'timezone': 0,
-            'units': 'metric',
         }
 
+    @mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle(self, protocol):
+        home = Point(52.015, -0.221, units='nautical', timezone=60)
+        format(home, 'dms')
+        restored = pickle.loads(pickle.dumps(home, protocol))
+        assert repr(restored) == repr(home)
+        assert restored.__dict__ == home.__dict__
+
+    def test_invalid_update(self):
+        home = Point(52.015, -0.221)
+        with raises(ValueError, match='Invalid latitude value 91'):
+            home.latitude = 91
+        with raises(ValueError, match='Invalid longitude value 181'):
+            home.longitude = 181
+        assert repr(home) == "Point(52.015, -0.221, 'metric', 'degrees', 0)"
+        assert home.rad_latitude == math.radians(52.015)
+
+    def test_rad_latitude_read_only(self):
+        home = Point(52.015, -0.221)
+        with raises(AttributeError):
+            home.rad_latitude = 0
+
+    def test_latitude_update(self):
+        home = Point(52.015, -0.221)
+        dest = Point(52.6333, -2.5)
+        distance = home.distance(dest)
+        home.latitude = 0
+        assert home.distance(dest) != distance
+        assert home.distance(dest) == Point(0, -0.221).distance(dest)
+
+    def test_units(self):
+        home = Point(52.015, -0.221)
+        dest = Point(52.6333, -2.5)
+        home.units = 'nm'
+        assert home.units == 'nautical'
+        nautical = Point(52.015, -0.221, 'nautical')
+        assert home.distance(dest) == nautical.distance(dest)
+        with raises(ValueError, match="Unknown units type 'furlongs'"):
+            home.units = 'furlongs'
+
+    def test___hash__(self):
+        home = Point(52.015, -0.221)
+        assert hash(home) == hash(Point(52.015, -0.221))
+        home.latitude = 52.6333
+        assert hash(home) == hash(Point(52.6333, -0.221))
+
+    def test___format___cache(self):
+        home = Point(52.015, -0.221)
+        assert format(home, 'dm') == '52°00.90′N, 000°13.26′W'
+        home.latitude = -52.015
+        assert format(home, 'dm') == '52°00.90′S, 000°13.26′W'
+
+    def test_custom_attribute(self):
+        home = Point(52.015, -0.221)
+        home.name = 'home'
+        assert home.name == 'home'
+
     def test___dict___custom_class(self):
         class Test(Point):
             def __init__(self, latitude, longitude):
@@ -72,8 +135,13 @@ class TestPoint:
             '_longitude': -0.221,
             '_rad_latitude': 0.9078330104248505,
             '_rad_longitude': -0.0038571776469074684,
+            '_sin_lat': 0.7881719063975099,
+            '_cos_lat': 0.6154551534967555,
+            '_hash': None,
+            '_format_cache': None,
+            '_unit_scale': 1,
+            '_units': 'metric',
             'timezone': 0,
-            'units': 'metric',
         }
 
     def test___repr__(self):
@@ -105,6 +173,10 @@ class TestPoint:
     def test___ne__(self):
         assert Point(52.015, -0.221) != Point(52.6333, -2.5)
 
+    def test___ne___attributes(self):
+        assert Point(52.015, -0.221) != Point(52.015, -0.221, 'nautical')
+        assert Point(52.015, -0.221) != Point(52.015, -0.222)
+
     @mark.parametrize(
         'accuracy, result',
         [
@@ -123,10 +195,23 @@ class TestPoint:
         dest = Point(52.6333, -2.5)
         assert home.distance(dest) == approx(169, rel=0.5)
         assert home.distance(dest, method='sloc') == approx(169, rel=0.5)
+        assert home.distance(dest, method='equirectangular') == approx(
+            home.distance(dest), rel=0.001
+        )
 
         with raises(ValueError, match="Unknown method type 'Invalid'"):
             home.distance(dest, method='Invalid')
 
+    def test_distance_equirectangular_antimeridian(self):
+        east = Point(0, 179.5)
+        west = Point(0, -179.5)
+        assert east.distance(west, 'equirectangular') == approx(
+            east.distance(west)
+        )
+        assert west.distance(east, 'equirectangular') == approx(
+            west.distance(east)
+        )
+
     @mark.parametrize(
         'units, result',
         [
@@ -178,6 +263,14 @@ class TestPoint:
     def test_midpoint(self, p1, p2, result):
         assert p1.midpoint(p2) == result
 
+    def test_midpoint_attributes(self):
+        home = Point(52.015, -0.221, 'nautical', timezone=60)
+        result = home.midpoint(Point(52.6333, -2.5))
+        expected = Point(
+            result.rad_latitude, result.rad_longitude, angle='radians'
+        )
+        assert result.__dict__ == expected.__dict__
+
     @mark.parametrize(
         'p1, p2, result',
         [
@@ -273,6 +366,12 @@ class TestPoint:
         assert int(bearing) == 294
         assert int(dist) == 169
 
+    @mark.parametrize('units', ['metric', 'imperial', 'nautical'])
+    def test_inverse_matches(self, units):
+        home = Point(52.015, -0.221, units)
+        dest = Point(52.6333, -2.5)
+        assert home.inverse(dest) == (home.bearing(dest), home.distance(dest))
+
 
 class TestPoints:
     def setup(self):
@@ -280,6 +379,16 @@ class TestPoints:
             ['52.015;-0.221', '52.168;0.040', '52.855;0.657'], parse=True
         )
 
+    def test_custom_attribute(self):
+        self.locs.name = 'route'
+        assert self.locs.name == 'route'
+
+    @mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle(self, protocol):
+        restored = pickle.loads(pickle.dumps(self.locs, protocol))
+        assert restored == self.locs
+        assert restored.__dict__ == self.locs.__dict__
+
     def test___repr__(self):
         locations = [Point(0, 0)] * 4
         assert repr(Points(locations)) == (
@@ -299,9 +408,75 @@ class TestPoints:
             "False, 'metric')"
         )
 
+    def test_import_locations_repeated(self):
+        locations = Points()
+        locations.import_locations(['52.015 -0.221', '52.015 -0.221'])
+        assert locations[0] == locations[1]
+        assert locations[0] is not locations[1]
+        locations[0].latitude = 0
+        assert locations[1].latitude == 52.015
+
     def test_distance(self):
         assert sum(self.locs.distance()) == approx(111.632, rel=0.001)
 
+    @mark.parametrize('method', ['haversine', 'sloc', 'equirectangular'])
+    def test_distance_matches_point(self, method):
+        assert list(self.locs.distance(method)) == [
+            self.locs[0].distance(self.locs[1], method),
+            self.locs[1].distance(self.locs[2], method),
+        ]
+
+    @mark.parametrize('method', ['haversine', 'sloc', 'equirectangular'])
+    def test_pairwise_distance(self, method):
+        others = [Point(52.6333, -2.5), Point(36.12, -86.67)]
+        result = self.locs.pairwise_distance(others, method)
+        for location, row in zip(self.locs, result):
+            assert row == [
+                approx(location.distance(other, method), rel=1e-12)
+                for other in others
+            ]
+
+    def test_pairwise_distance_self(self):
+        result = self.locs.pairwise_distance(self.locs)
+        assert [result[i][i] for i in range(len(self.locs))] == [0, 0, 0]
+
+    def test_pairwise_distance_invalid_method(self):
+        with raises(ValueError, match='Unknown method type'):
+            self.locs.pairwise_distance(self.locs, 'pythagoras')
+
+    @mark.parametrize(
+        'method, args, length',
+        [
+            ('distance', (), 2),
+            ('bearing', (), 2),
+            ('final_bearing', (), 2),
+            ('inverse', (), 2),
+            ('midpoint', (), 2),
+            ('range', (Point(52.015, -0.221), 20), 1),
+            ('destination', (42, 240), 3),
+        ],
+    )
+    def test_materialised_results(self, method, args, length):
+        result = getattr(self.locs, method)(*args)
+        assert isinstance(result, list)
+        assert len(result) == length
+
+    @mark.parametrize('method', ['haversine', 'sloc', 'equirectangular'])
+    def test_pairwise_distance_antipodal(self, method):
+        location = Point(0.4029405180269521, 173.5475895138723)
+        antipode = Point(-0.4029405180269521, -6.45241048612769)
+        locations = Points([location, antipode] + list(self.locs))
+        result = locations.pairwise_distance(locations, method)
+        for i, row in enumerate(result):
+            assert row[i] == approx(0, abs=0.001)
+        if method != 'equirectangular':
+            assert result[0][1] == approx(location.distance(antipode))
+            assert result[1][0] == approx(location.distance(antipode))
+
+    def test_distance_invalid_method(self):
+        with raises(ValueError, match='Unknown method type'):
+            self.locs.distance('pythagoras')
+
     def test_bearing(self):
         assert list(self.locs.bearing()) == [
             approx(46.242, rel=0.001),
@@ -335,6 +510,18 @@ class TestPoints:
             Point(52.015, -0.221, 'metric', 'degrees', 0)
         ]
 
+    @mark.parametrize(
+        'units, distance, result',
+        [('metric', 25, 2), ('imperial', 16, 2), ('nautical', 13, 1)],
+    )
+    def test_range_units(self, units, distance, result):
+        location = Point(52.015, -0.221, units)
+        assert len(list(self.locs.range(location, distance))) == result
+
+    def test_range_latitude_band(self):
+        locations = Points([Point(52, 0), Point(52, 90), Point(-52, 0)])
+        assert locations.range(Point(52.5, 0), 100) == [Point(52, 0)]
+
     def test_destination(self):
         assert list(self.locs.destination(42, 240)) == [
             Point(
@@ -348,6 +535,21 @@ class TestPoints:
             ),
         ]
 
+    def test_destination_mixed_units(self):
+        locations = Points(
+            [
+                Point(52.015, -0.221),
+                Point(52.6333, -2.5, units='imperial'),
+                Point(36.12, -86.67, units='nautical'),
+                Point(33.94, -118.4),
+            ]
+        )
+        expected = [x.destination(42, 240) for x in locations]
+        result = locations.destination(42, 240)
+        assert [(x.latitude, x.longitude) for x in result] == [
+            (x.latitude, x.longitude) for x in expected
+        ]
+
     def test_sunrise(self):
         assert list(self.locs.sunrise(datetime.date(2008, 5, 2))) == [
             datetime.time(4, 28),
@@ -369,6 +571,21 @@ class TestPoints:
             (datetime.time(4, 21), datetime.time(19, 27)),
         ]
 
+    @mark.parametrize('method', ['sunrise', 'sunset', 'sun_events'])
+    def test_sun_default_date(self, method):
+        today = datetime.date.today()
+        assert getattr(self.locs, method)() == [
+            getattr(x, method)(today) for x in self.locs
+        ]
+
+    @mark.parametrize('zenith', [None, 'civil', 'nautical', 'astronomical'])
+    @mark.parametrize('method', ['sunrise', 'sunset', 'sun_events'])
+    def test_sun_zenith(self, method, zenith):
+        date = datetime.date(2008, 5, 29)
+        assert getattr(self.locs, method)(date, zenith) == [
+            getattr(x, method)(date, zenith) for x in self.locs
+        ]
+
     @mark.parametrize(
         'accuracy, result',
         [
@@ -379,6 +596,10 @@ class TestPoints:
     def test_to_grid_locator(self, accuracy, result):
         assert list(self.locs.to_grid_locator(accuracy)) == result
 
+    def test_to_grid_locator_invalid_precision(self):
+        with raises(ValueError, match='Unsupported precision'):
+            self.locs.to_grid_locator('baseball')
+
 
 class TestTimedPoints:
     def test_speed(self):
@@ -396,7 +617,7 @@ class TestTimedPoints:
                 ),
             ]
         )
-        assert list(locations.speed()) == [
+        assert locations.speed() == [
             approx(12.315, rel=0.001),
             approx(133.849, rel=0.001),
         ]
@@ -427,6 +648,25 @@ class TestKeyedPoints:
             'metric',
         )
 
+    @mark.parametrize(
+        'method, args, length',
+        [
+            ('distance', (('home', 'Carol', 'Kenny'),), 2),
+            ('bearing', (('home', 'Carol', 'Kenny'),), 2),
+            ('final_bearing', (('home', 'Carol', 'Kenny'),), 2),
+            ('inverse', (('home', 'Carol', 'Kenny'),), 2),
+            ('midpoint', (('home', 'Carol', 'Kenny'),), 2),
+            ('range', (Point(52.015, -0.221), 20), 1),
+            ('destination', (42, 240), 3),
+            ('sun_events', (datetime.date(2008, 5, 2),), 3),
+            ('to_grid_locator', (), 3),
+        ],
+    )
+    def test_materialised_results(self, method, args, length):
+        result = getattr(self.locs, method)(*args)
+        assert isinstance(result, list)
+        assert len(result) == length
+
     def test_distance(self):
         assert sum(self.locs.distance(('home', 'Carol', 'Kenny'))) == approx(
             111.632, rel=0.001
@@ -461,7 +701,7 @@ class TestKeyedPoints:
         ]
 
     def test_range(self):
-        assert list(self.locs.range(Point(52.015, -0.221), 20)) == [
+        assert self.locs.range(Point(52.015, -0.221), 20) == [
             ('home', Point(52.015, -0.221, 'metric', 'degrees', 0))
         ]
 
@@ -499,6 +739,13 @@ class TestKeyedPoints:
             ),
         ]
 
+    def test_destination_keys(self):
+        result = self.locs.destination(42, 240)
+        assert isinstance(result, list)
+        assert result == [
+            (k, v.destination(42, 240)) for k, v in self.locs.items()
+        ]
+
     def test_sunrise(self):
         assert sorted(self.locs.sunrise(datetime.date(2008, 5, 2))) == [
             ('Carol', datetime.time(4, 26)),
@@ -520,6 +767,13 @@ class TestKeyedPoints:
             ('home', (datetime.time(4, 28), datetime.time(19, 28))),
         ]
 
+    @mark.parametrize('method', ['sunrise', 'sunset', 'sun_events'])
+    def test_sun_default_date(self, method):
+        today = datetime.date.today()
+        assert getattr(self.locs, method)() == [
+            (k, getattr(v, method)(today)) for k, v in self.locs.items()
+        ]
+
     @mark.parametrize(
         'accuracy, result',
         [
@@ -71,3 +71,15 @@ class TestTrigpoints:
             '500968 - Brown Hill Nm  See The Heights (53°38′23″N, 001°39′34″W)',
             '501414 - Cheriton Hill Nm  See Paddlesworth (51°06′03″N, 001°08′33″E)',
         ]
+
+    def test_import_locations_extra_fields(self):
+        markers = Trigpoints(
+            [
+                'H  SOFTWARE NAME & VERSION\n',
+                '\n',
+                'W,506514,N51.524158,W000.711212,    92.0,Foo, Bar\n',
+            ]
+        )
+        assert list(markers) == [506514]
+        assert markers[506514].identity == 506514
+        assert str(markers[506514]) == 'Foo (51°31′26″N, 000°42′40″W alt 92m)'
@@ -18,6 +18,7 @@
 # You should have received a copy of the GNU General Public License along with
 # upoints.  If not, see <http://www.gnu.org/licenses/>.
 
+import pickle
 from operator import attrgetter
 
 from pytest import mark
@@ -55,6 +56,23 @@ class TestZone:
     def test___str__(self, args, result):
         assert str(Zone(*args)) == result
 
+    def test_custom_attribute(self):
+        zone = Zone('+513030-0000731', 'GB', 'Europe/London')
+        zone.offset = 0
+        assert zone.offset == 0
+
+    def test_pickle(self):
+        zone = Zone('+513030-0000731', 'GB', 'Europe/London', ['London'])
+        restored = pickle.loads(pickle.dumps(zone))
+        assert repr(restored) == repr(zone)
+        assert restored.__dict__ == zone.__dict__
+
+    def test___str___location_update(self):
+        zone = Zone('+513030-0000731', 'GB', 'Europe/London')
+        assert str(zone) == 'Europe/London (GB: 51°30′30″N, 000°07′30″W)'
+        zone.latitude = 52
+        assert str(zone) == 'Europe/London (GB: 52°00′00″N, 000°07′30″W)'
+
 
 class TestZones:
     def setup(self):
@@ -69,6 +87,18 @@ class TestZones:
             """Antarctica/McMurdo (AQ: 77°50′00″S, 166°36′00″E also McMurdo Station, Ross Island)""",
         ]
 
+    def test_import_locations_comments(self):
+        zones = Zones(
+            [
+                '# country-code\tcoordinates\tTZ\tcomments\n',
+                '\n',
+                'AO\t-0848+01314\tAfrica/Luanda\n',
+            ]
+        )
+        assert [str(zone) for zone in zones] == [
+            'Africa/Luanda (AO: 08°48′00″S, 013°14′00″E)'
+        ]
+
     def test_dump_zone_file(self):
         assert Zones.dump_zone_file(self.zones) == [
             'AN\t+121100-0690000\tAmerica/Curacao',
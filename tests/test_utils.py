@@ -111,6 +111,11 @@ def test_prepare_read_read():
                 {'last': 'caro', 'first': 'ell'},
             ],
         ),
+        (
+            ['first,last', 'James,Rowe'],
+            None,
+            [{'last': 'Rowe', 'first': 'James'}],
+        ),
     ],
 )
 def test_prepare_csv_read(data, keys, result):
@@ -121,6 +126,11 @@ def test_prepare_csv_read(data, keys, result):
     'data, result',
     [
         (open('tests/data/real_file.xml'), 'This is a test file-type object'),
+        (
+            open('tests/data/real_file.xml', 'rb'),
+            'This is a test file-type object',
+        ),
+        ('tests/data/real_file.xml', 'This is a test file-type object'),
         (
             ['<xml>', '<tag>This is a test list</tag>', '</xml>'],
             'This is a test list',
@@ -132,6 +142,11 @@ def test_prepare_xml_read(data, result):
     assert xml.find('tag').text == result
 
 
+def test_prepare_xml_read_invalid():
+    with raises(TypeError, match='Unable to handle data of type'):
+        prepare_xml_read(42)
+
+
 @mark.parametrize(
     'angle, result',
     [
@@ -344,6 +359,19 @@ def test_to_iso6709_location_page(args, kwargs, result):
     assert to_iso6709(*args, **kwargs) == result
 
 
+@mark.parametrize(
+    'args, result',
+    [
+        ((-8.8, 13.233333, None, 'dm'), '-0848+01313/'),
+        ((-8.8, 13.233333, None, 'dms'), '-084800+0131359/'),
+        ((51.508333, -0.125, None, 'dms'), '+513029-0000730/'),
+        ((-77.833333, -166.6, 12.5, 'dm'), '-7749-16636+12.500/'),
+    ],
+)
+def test_to_iso6709_hemispheres(args, result):
+    assert to_iso6709(*args) == result
+
+
 def test_angle_to_distance():
     assert angle_to_distance(1) == approx(111.125, rel=0.001)
     assert angle_to_distance(360, 'imperial') == approx(24863, rel=0.001)
@@ -418,6 +446,10 @@ def test_sun_no_rise():
     assert sun_rise_set(89, 0, datetime.date(2007, 12, 21)) is None
 
 
+def test_sun_no_set():
+    assert sun_rise_set(89, 0, datetime.date(2007, 6, 21), 'set') is None
+
+
 def test_sun_rise_zone():
     assert sun_rise_set(
         52.015, -0.221, datetime.date(2007, 6, 15), timezone=60
@@ -441,6 +473,16 @@ def test_sun_set_zone():
     ) == datetime.time(21, 22)
 
 
+def test_sun_rise_set_invalid_time():
+    with raises(ValueError, match='hour must be in'):
+        sun_rise_set(51.14, -142.25, datetime.date(2020, 1, 14), 'rise', 765)
+
+
+def test_sun_rise_set_invalid_mode():
+    with raises(ValueError, match='Unknown mode'):
+        sun_rise_set(52.015, -0.221, datetime.date(2007, 6, 15), 'noon')
+
+
 @mark.parametrize(
     'date, result',
     [
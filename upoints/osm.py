@@ -18,10 +18,14 @@
 # You should have received a copy of the GNU General Public License along with
 # upoints.  If not, see <http://www.gnu.org/licenses/>.
 
-from contextlib import suppress
-from operator import attrgetter
+import math
+import sys
 
-from urllib.request import urlopen
+from array import array
+from functools import lru_cache
+from itertools import chain
+
+from urllib.request import Request, urlopen
 
 from lxml import etree
 
@@ -40,17 +44,22 @@ def _parse_flags(element):
     Returns:
         tuple: Generic OSM data for object instantiation
     """
-    visible = True if element.get('visible') else False
-    user = element.get('user')
-    timestamp = element.get('timestamp')
-    if timestamp:
-        timestamp = utils.Timestamp.parse_isoformat(timestamp)
-    tags = {}
-    with suppress(AttributeError):
-        for tag in element['tag']:
-            key = tag.get('k')
-            value = tag.get('v')
-            tags[key] = value
+    attrib = element.attrib
+    visible = attrib.get('visible') == 'true'
+    user = attrib.get('user')
+    if user:
+        # Exports tend to have few users, but they appear on every element
+        user = sys.intern(user)
+    timestamp = attrib.get('timestamp')
+    timestamp = (
+        utils.Timestamp.parse_isoformat(timestamp) if timestamp else None
+    )
+    # Tag keys are drawn from a small vocabulary, so share a single string
+    # object for each key across the whole import
+    tags = {
+        sys.intern(tag.attrib['k']): tag.attrib['v']
+        for tag in element.iterchildren('tag')
+    }
 
     return visible, user, timestamp, tags
 
@@ -70,16 +79,99 @@ def _get_flags(osm_obj):
     if osm_obj.user:
         flags.append(f'user: {osm_obj.user}')
     if osm_obj.timestamp:
-        flags.append('timestamp: %s' % osm_obj.timestamp.isoformat())
+        flags.append(f'timestamp: {osm_obj.timestamp.isoformat()}')
     if osm_obj.tags:
         flags.append(
             ', '.join(
-                '%s: %s' % (k, v) for k, v in sorted(osm_obj.tags.items())
+                f'{k}: {v}' for k, v in sorted(osm_obj.tags.items())
             )
         )
     return flags
 
 
+def _iter_elements(osm_file, chunk_size=65536):
+    """Stream elements from OSM data.
+
+    Elements are cleared once they have been handled by the caller, so only the
+    root element and the current child are held in memory.
+
+    Args:
+        osm_file (iter): OpenStreetMap data to read
+        chunk_size (int): Number of bytes to read from files at a time
+
+    Yields:
+        etree.Element: Root element, followed by each of its children
+
+    Raises:
+        TypeError: Invalid value for ``osm_file``
+    """
+    parser = etree.XMLPullParser(events=('start', 'end'))
+    root = None
+    for chunk in utils._xml_chunks(osm_file, chunk_size):
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            if root is None:
+                root = elem
+                yield root
+            elif event == 'end' and elem.getparent() is root:
+                yield elem
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del root[0]
+    parser.close()
+
+
+#: Sine and cosine of the bearings used to build area bounding boxes
+_AREA_BEARINGS = [
+    (math.sin(bearing), math.cos(bearing))
+    for bearing in map(math.radians, range(0, 360, 90))
+]
+
+
+@lru_cache(maxsize=1024)
+def _area_bounds(rad_latitude, rad_longitude, angular_distance):
+    """Calculate the bounding box touching a circle around a location.
+
+    This is :meth:`point.Point.destination` unrolled for the four compass
+    points, working purely on floats so that the trigonometry shared between
+    them is only calculated once.  Results are cached, as area URLs are often
+    requested repeatedly for the same location.
+
+    Args:
+        rad_latitude (float): Latitude of the circle’s centre in radians
+        rad_longitude (float): Longitude of the circle’s centre in radians
+        angular_distance (float): Radius of the circle in radians
+
+    Returns:
+        tuple of float: Minimum longitude, minimum latitude, maximum longitude
+            and maximum latitude in degrees
+    """
+    sin_latitude = math.sin(rad_latitude)
+    cos_latitude = math.cos(rad_latitude)
+    sin_distance = math.sin(angular_distance)
+    cos_distance = math.cos(angular_distance)
+    latitudes = []
+    longitudes = []
+    for sin_bearing, cos_bearing in _AREA_BEARINGS:
+        latitude = math.asin(
+            sin_latitude * cos_distance
+            + cos_latitude * sin_distance * cos_bearing
+        )
+        longitude = rad_longitude + math.atan2(
+            sin_bearing * sin_distance * cos_latitude,
+            cos_distance - sin_latitude * math.sin(latitude),
+        )
+        latitudes.append(latitude)
+        longitudes.append(longitude)
+
+    return (
+        math.degrees(min(longitudes)),
+        math.degrees(min(latitudes)),
+        math.degrees(max(longitudes)),
+        math.degrees(max(latitudes)),
+    )
+
+
 def get_area_url(location, distance):
     """Generate URL for downloading OSM data within a region.
 
@@ -102,11 +194,12 @@ def get_area_url(location, distance):
         str: URL that can be used to fetch the OSM data within ``distance`` of
             ``location``
     """
-    locations = [location.destination(i, distance) for i in range(0, 360, 90)]
-    latitudes = list(map(attrgetter('latitude'), locations))
-    longitudes = list(map(attrgetter('longitude'), locations))
-
-    bounds = (min(longitudes), min(latitudes), max(longitudes), max(latitudes))
+    _, scale = utils._resolve_units(location.units)
+    bounds = _area_bounds(
+        location.rad_latitude,
+        location.rad_longitude,
+        distance * scale / utils.BODY_RADIUS,
+    )
 
     return 'http://api.openstreetmap.org/api/0.5/map?bbox=' + ','.join(
         map(str, bounds)
@@ -155,12 +248,12 @@ class Node(point.Point):
             str: Human readable string representation of ``Node`` object
         """
         text = [
-            'Node %i (%s)' % (self.ident, super(Node, self).__format__('dms')),
+            f"Node {self.ident} ({super(Node, self).__format__('dms')})",
         ]
         flags = _get_flags(self)
 
         if flags:
-            text.append('[%s]' % ', '.join(flags))
+            text.append(f"[{', '.join(flags)}]")
         return ' '.join(text)
 
     def toosm(self):
@@ -169,22 +262,20 @@ class Node(point.Point):
         Returns:
             etree.Element: OSM node element
         """
-        node = create_elem(
-            'node',
-            {
-                'id': str(self.ident),
-                'lat': str(self.latitude),
-                'lon': str(self.longitude),
-            },
-        )
-        node.set('visible', 'true' if self.visible else 'false')
+        attrs = {
+            'id': str(self.ident),
+            'lat': str(self.latitude),
+            'lon': str(self.longitude),
+            'visible': 'true' if self.visible else 'false',
+        }
         if self.user:
-            node.set('user', self.user)
+            attrs['user'] = self.user
         if self.timestamp:
-            node.set('timestamp', self.timestamp.isoformat())
+            attrs['timestamp'] = self.timestamp.isoformat()
+        node = create_elem('node', attrs)
         if self.tags:
             for key, value in sorted(self.tags.items()):
-                node.append(create_elem('tag', {'k': key, 'v': value}))
+                etree.SubElement(node, 'tag', {'k': key, 'v': value})
 
         return node
 
@@ -203,13 +294,20 @@ class Node(point.Point):
     def fetch_area_osm(self, distance):
         """Fetch, and import, an OSM region.
 
+        The response is parsed as it is downloaded, so objects are created
+        while the remainder of the data is still arriving.
+
         Args:
             distance (int): Boundary distance in kilometres
 
         Returns:
             Osm: All the data OSM has on a region imported for use
         """
-        return Osm(urlopen(get_area_url(self, distance)))
+        request = Request(
+            get_area_url(self, distance), headers={'User-Agent': ua_string}
+        )
+        with urlopen(request) as response:
+            return Osm(response)
 
     @staticmethod
     def parse_elem(element):
@@ -221,9 +319,10 @@ class Node(point.Point):
         Returns:
             Node: Object representing parsed element
         """
-        ident = int(element.get('id'))
-        latitude = element.get('lat')
-        longitude = element.get('lon')
+        attrib = element.attrib
+        ident = int(attrib['id'])
+        latitude = float(attrib['lat'])
+        longitude = float(attrib['lon'])
 
         flags = _parse_flags(element)
 
@@ -243,7 +342,7 @@ class Way(point.Points):
 
         Args:
             ident (int): Unique identifier for the way
-            nodes (list of str): Identifiers of the nodes that form this way
+            nodes (list of int): Identifiers of the nodes that form this way
             visible (bool): Whether the way is visible
             user (str): User who logged the way
             timestamp (str): The date and time a way was logged
@@ -277,17 +376,17 @@ class Way(point.Points):
             str: Human readable string representation of ``Way`` object
         """
         text = [
-            'Way %i' % (self.ident),
+            f'Way {self.ident}',
         ]
         if not nodes:
-            text.append(' (nodes: %s)' % str(self[:])[1:-1])
+            text.append(f' (nodes: {str(self[:])[1:-1]})')
         flags = _get_flags(self)
 
         if flags:
-            text.append(' [%s]' % ', '.join(flags))
+            text.append(f" [{', '.join(flags)}]")
         if nodes:
             text.append('\n')
-            text.append('\n'.join('    %s' % nodes[node] for node in self[:]))
+            text.append('\n'.join(f'    {nodes[node]!s}' for node in self[:]))
 
         return ''.join(text)
 
@@ -297,18 +396,21 @@ class Way(point.Points):
         Returns:
             etree.Element: OSM way element
         """
-        way = create_elem('way', {'id': str(self.ident)})
-        way.set('visible', 'true' if self.visible else 'false')
+        attrs = {
+            'id': str(self.ident),
+            'visible': 'true' if self.visible else 'false',
+        }
         if self.user:
-            way.set('user', self.user)
+            attrs['user'] = self.user
         if self.timestamp:
-            way.set('timestamp', self.timestamp.isoformat())
+            attrs['timestamp'] = self.timestamp.isoformat()
+        way = create_elem('way', attrs)
         if self.tags:
             for key, value in sorted(self.tags.items()):
-                way.append(create_elem('tag', {'k': key, 'v': value}))
+                etree.SubElement(way, 'tag', {'k': key, 'v': value})
 
         for node in self:
-            way.append(create_elem('nd', {'ref': str(node)}))
+            etree.SubElement(way, 'nd', {'ref': str(node)})
 
         return way
 
@@ -322,12 +424,158 @@ class Way(point.Points):
         Returns:
             Way: `Way` object representing parsed element
         """
-        ident = int(element.get('id'))
+        ident = int(element.attrib['id'])
         flags = _parse_flags(element)
-        nodes = [node.get('ref') for node in element.findall('nd')]
+        nodes = [
+            int(node.attrib['ref']) for node in element.iterchildren('nd')
+        ]
         return Way(ident, nodes, *flags)
 
 
+class Nodes:
+    """Class for compactly storing a group of :class:`Node` objects.
+
+    Node data is stored in columns, with the numeric fields held in
+    :mod:`array` objects and the sparsely populated fields in mappings keyed
+    by index.  :class:`Node` objects are only created when accessed.
+
+    .. versionadded:: 0.13.0
+    """
+
+    def __init__(self, nodes=None):
+        """Initialise a new ``Nodes`` object.
+
+        Args:
+            nodes (list of Node): :class:`Node` objects to store
+        """
+        self.ident = array('q')
+        self.latitude = array('d')
+        self.longitude = array('d')
+        self.visible = bytearray()
+        self.user = {}
+        self.timestamp = {}
+        self.tags = {}
+        if nodes:
+            for node in nodes:
+                self.append(node)
+
+    def __repr__(self):
+        """Self-documenting string representation.
+
+        Returns:
+            str: String to recreate ``Nodes`` object
+        """
+        return utils.repr_assist(self, {'nodes': list(self)})
+
+    def __len__(self):
+        """Number of stored nodes.
+
+        Returns:
+            int: Number of stored nodes
+        """
+        return len(self.ident)
+
+    def __getitem__(self, index):
+        """Create :class:`Node` objects from stored data.
+
+        Args:
+            index (int or slice): Position of node, or slice of positions
+
+        Returns:
+            Node or list of Node: Node object for data at ``index``, or a list
+                of them if ``index`` is a slice
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        ident = self.ident[index]
+        if index < 0:
+            index += len(self)
+        return Node(
+            ident,
+            self.latitude[index],
+            self.longitude[index],
+            bool(self.visible[index]),
+            self.user.get(index),
+            self.timestamp.get(index),
+            self.tags.get(index, {}),
+        )
+
+    def __iter__(self):
+        """Iterate over stored nodes.
+
+        Yields:
+            Node: Node object for each stored node
+        """
+        # Walk the columns together, instead of indexing each one per node
+        columns = zip(self.ident, self.latitude, self.longitude, self.visible)
+        for index, (ident, latitude, longitude, visible) in enumerate(columns):
+            yield Node(
+                ident,
+                latitude,
+                longitude,
+                bool(visible),
+                self.user.get(index),
+                self.timestamp.get(index),
+                self.tags.get(index, {}),
+            )
+
+    def append(self, node):
+        """Store a :class:`Node` object.
+
+        Args:
+            node (Node): Node to store
+        """
+        self._append(
+            node.ident,
+            node.latitude,
+            node.longitude,
+            node.visible,
+            node.user,
+            node.timestamp,
+            node.tags,
+        )
+
+    def _append(
+        self, ident, latitude, longitude, visible, user, timestamp, tags
+    ):
+        """Store node data.
+
+        Args:
+            ident (int): Unique identifier for the node
+            latitude (float): Nodes’s latitude
+            longitude (float): Node’s longitude
+            visible (bool): Whether the node is visible
+            user (str): User who logged the node
+            timestamp (utils.Timestamp): The date and time a node was logged
+            tags (dict): Tags associated with the node
+        """
+        index = len(self.ident)
+        self.ident.append(ident)
+        self.latitude.append(latitude)
+        self.longitude.append(longitude)
+        self.visible.append(visible)
+        if user:
+            self.user[index] = user
+        if timestamp:
+            self.timestamp[index] = timestamp
+        if tags:
+            self.tags[index] = tags
+
+    def parse_elem(self, element):
+        """Parse, and store, a OSM node XML element.
+
+        Args:
+            element (etree.Element): XML Element to parse
+        """
+        attrib = element.attrib
+        self._append(
+            int(attrib['id']),
+            float(attrib['lat']),
+            float(attrib['lon']),
+            *_parse_flags(element),
+        )
+
+
 class Osm(point.Points):
     """Class for representing an OSM region.
 
@@ -338,12 +586,13 @@ class Osm(point.Points):
         """Initialise a new ``Osm`` object."""
         super(Osm, self).__init__()
         self._osm_file = osm_file
+        self.nodes = None
         if osm_file:
             self.import_locations(osm_file)
         self.generator = ua_string
         self.version = '0.5'
 
-    def import_locations(self, osm_file):
+    def import_locations(self, osm_file, filter_ways=False, compact=False):
         """Import OSM data files.
 
         ``import_locations()`` returns a list of ``Node`` and ``Way`` objects.
@@ -370,9 +619,19 @@ class Osm(point.Points):
               </way>
             </osm>
 
-        The reader uses the :mod:`ElementTree` module, so should be very fast
-        when importing data.  The above file processed by
-        ``import_locations()`` will return the following `Osm` object::
+        The reader streams the data using :mod:`lxml`, so should be very fast
+        when importing data.  If ``filter_ways`` is set the data is read twice,
+        first to find the nodes referenced by ways and then to import only
+        those nodes along with the ways themselves.  This considerably reduces
+        the memory required for large regions, but requires ``osm_file`` to be
+        a seekable file, a filename or a list.
+
+        If ``compact`` is set nodes are stored in the :attr:`nodes` attribute,
+        a column-oriented :class:`Nodes` object, instead of as :class:`Node`
+        objects in the ``Osm`` object itself.  :attr:`nodes` is replaced on
+        every import, and is ``None`` unless ``compact`` is set.  The above
+        file processed by ``import_locations()`` will return the following
+        `Osm` object::
 
             Osm([
                 Node(0, 52.015749, -0.221765, True, 'jnrowe',
@@ -390,15 +649,75 @@ class Osm(point.Points):
 
         Args:
             osm_file (iter): OpenStreetMap data to read
+            filter_ways (bool): Only import nodes that are referenced by ways
+            compact (bool): Store nodes in a column-oriented :class:`Nodes`
+                object
 
         Returns:
             Osm: Nodes and ways from the data
 
+        Raises:
+            ValueError: Unsupported data format
+            ValueError: ``filter_ways`` used with data that is not seekable
+
         .. _OpenStreetMap 0.5 DTD:
             http://wiki.openstreetmap.org/wiki/OSM_Protocol_Version_0.5/DTD
         """
         self._osm_file = osm_file
-        data = utils.prepare_xml_read(osm_file, objectify=True)
+
+        if filter_ways:
+            if hasattr(osm_file, 'read'):
+                if not osm_file.seekable():
+                    raise ValueError('Filtering ways requires seekable data')
+                start = osm_file.tell()
+            refs = set()
+            for elem in self._iter_children(osm_file):
+                if elem.tag == 'way':
+                    refs.update(
+                        int(node.attrib['ref'])
+                        for node in elem.iterchildren('nd')
+                    )
+            if hasattr(osm_file, 'read'):
+                osm_file.seek(start)
+
+        # Resolve the methods used in the loop just once, as it runs for every
+        # element in what may be a very large file.  Objects are appended
+        # directly, as list growth is already amortised and batching them in
+        # a local list for extend() measures slower.
+        append = self.append
+        parse_node = Node.parse_elem
+        parse_way = Way.parse_elem
+        self.nodes = None
+        if compact:
+            self.nodes = Nodes()
+            store_node = self.nodes.parse_elem
+
+        for elem in self._iter_children(osm_file):
+            tag = elem.tag
+            if tag == 'node':
+                if filter_ways and int(elem.attrib['id']) not in refs:
+                    continue
+                if compact:
+                    store_node(elem)
+                else:
+                    append(parse_node(elem))
+            elif tag == 'way':
+                append(parse_way(elem))
+
+    def _iter_children(self, osm_file):
+        """Stream elements from OSM data, after checking for support.
+
+        Args:
+            osm_file (iter): OpenStreetMap data to read
+
+        Yields:
+            etree.Element: Children of the ``osm`` root element
+
+        Raises:
+            ValueError: Unsupported data format
+        """
+        elements = _iter_elements(osm_file)
+        data = next(elements)
 
         # This would be a lot simpler if OSM exports defined a namespace
         if not data.tag == 'osm':
@@ -411,17 +730,31 @@ class Osm(point.Points):
 
         self.generator = data.get('generator')
 
-        for elem in data.getchildren():
-            if elem.tag == 'node':
-                self.append(Node.parse_elem(elem))
-            elif elem.tag == 'way':
-                self.append(Way.parse_elem(elem))
+        yield from elements
 
-    def export_osm_file(self):
-        """Generate OpenStreetMap element tree from ``Osm``."""
-        osm = create_elem(
-            'osm', {'generator': self.generator, 'version': self.version}
-        )
-        osm.extend(obj.toosm() for obj in self)
+    def export_osm_file(self, osm_file=None):
+        """Generate OpenStreetMap element tree from ``Osm``.
 
-        return etree.ElementTree(osm)
+        If ``osm_file`` is given the data is written to it incrementally, one
+        object at a time, instead of building the full element tree in memory.
+
+        Args:
+            osm_file (str or file): Filename or binary file object to write to
+
+        Returns:
+            etree.ElementTree: OSM element tree depicting ``Osm`` object, if
+                ``osm_file`` isn’t given
+        """
+        attrs = {'generator': self.generator, 'version': self.version}
+        objects = chain(self.nodes or (), self)
+        if osm_file is None:
+            osm = create_elem('osm', attrs)
+            osm.extend(obj.toosm() for obj in objects)
+
+            return etree.ElementTree(osm)
+
+        with etree.xmlfile(osm_file, encoding='UTF-8') as xf:
+            xf.write_declaration()
+            with xf.element('osm', attrs):
+                for obj in objects:
+                    xf.write(obj.toosm())
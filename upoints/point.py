@@ -19,9 +19,17 @@
 # upoints.  If not, see <http://www.gnu.org/licenses/>.
 
 import math
+from functools import lru_cache
+from itertools import compress
+from operator import attrgetter
 
 from . import utils
 
+#: Conversion factors, matching those used by :func:`math.radians` and
+#: :func:`math.degrees`
+_DEG2RAD = math.pi / 180
+_RAD2DEG = 180 / math.pi
+
 
 def _manage_location(attr):
     """Build managed property interface.
@@ -33,7 +41,7 @@ def _manage_location(attr):
         property: Managed property interface
     """
     return property(
-        lambda self: getattr(self, f'_{attr}'),
+        attrgetter(f'_{attr}'),
         lambda self, value: self._set_location(attr, value),
     )
 
@@ -45,23 +53,686 @@ def _dms_formatter(latitude, longitude, mode):
         latitude (float): Location’s latitude
         longitude (float): Location’s longitude
         mode (str): Coordinate formatting system to use
-    """
-    chars = ('°', '′', '″')
 
-    latitude_dms = tuple(map(abs, utils.to_dms(latitude, mode)))
-    longitude_dms = tuple(map(abs, utils.to_dms(longitude, mode)))
-    text = []
-    if mode == 'dms':
-        text.append('%%02i%s%%02i%s%%02i%s' % chars % latitude_dms)
-    else:
-        text.append('%%02i%s%%05.2f%s' % chars[:2] % latitude_dms)
-    text.append('S' if latitude < 0 else 'N')
+    Returns:
+        str: Human readable location string
+    """
+    ns = 'S' if latitude < 0 else 'N'
+    ew = 'W' if longitude < 0 else 'E'
+    # Hemispheres are given by letter, so only magnitudes are needed
     if mode == 'dms':
-        text.append(', %%03i%s%%02i%s%%02i%s' % chars % longitude_dms)
+        lat_d, lat_m, lat_s = utils.to_dms(abs(latitude), mode)
+        lon_d, lon_m, lon_s = utils.to_dms(abs(longitude), mode)
+        return (
+            f'{lat_d:02d}°{lat_m:02d}′{int(lat_s):02d}″{ns}, '
+            f'{lon_d:03d}°{lon_m:02d}′{int(lon_s):02d}″{ew}'
+        )
     else:
-        text.append(', %%03i%s%%05.2f%s' % chars[:2] % longitude_dms)
-    text.append('W' if longitude < 0 else 'E')
-    return text
+        lat_d, lat_m = utils.to_dms(abs(latitude), mode)
+        lon_d, lon_m = utils.to_dms(abs(longitude), mode)
+        return (
+            f'{lat_d:02d}°{lat_m:05.2f}′{ns}, '
+            f'{lon_d:03d}°{lon_m:05.2f}′{ew}'
+        )
+
+
+def _haversine(latitude_difference, longitude_difference, cos1, cos2):
+    """Calculate the haversine distance between two locations.
+
+    Args:
+        latitude_difference (float): Difference in latitude, in radians
+        longitude_difference (float): Difference in longitude, in radians
+        cos1 (float): Cosine of the first location’s latitude
+        cos2 (float): Cosine of the second location’s latitude
+
+    Returns:
+        float: Distance between locations in metres
+    """
+    sin_latitude = math.sin(latitude_difference / 2)
+    sin_longitude = math.sin(longitude_difference / 2)
+    temp = sin_latitude * sin_latitude + cos1 * cos2 * (
+        sin_longitude * sin_longitude
+    )
+    # asin(√a) is equivalent to atan2(√a, √(1 − a)) for a in [0, 1], but needs
+    # one less square root and a cheaper inverse function
+    return 2 * utils.BODY_RADIUS * math.asin(math.sqrt(temp))
+
+
+def _sloc(longitude_difference, sin1, cos1, sin2, cos2):
+    """Calculate the spherical law of cosines distance between two locations.
+
+    Args:
+        longitude_difference (float): Difference in longitude, in radians
+        sin1 (float): Sine of the first location’s latitude
+        cos1 (float): Cosine of the first location’s latitude
+        sin2 (float): Sine of the second location’s latitude
+        cos2 (float): Cosine of the second location’s latitude
+
+    Returns:
+        float: Distance between locations in metres
+    """
+    return (
+        math.acos(sin1 * sin2 + cos1 * cos2 * math.cos(longitude_difference))
+        * utils.BODY_RADIUS
+    )
+
+
+def _equirectangular(latitude_difference, longitude_difference, cos_mean):
+    """Calculate the equirectangular approximate distance between locations.
+
+    Args:
+        latitude_difference (float): Difference in latitude, in radians
+        longitude_difference (float): Difference in longitude, in radians
+        cos_mean (float): Cosine of the locations’ mean latitude
+
+    Returns:
+        float: Distance between locations in metres
+    """
+    # Take the short way round when crossing the antimeridian
+    if longitude_difference > math.pi:
+        longitude_difference -= math.tau
+    elif longitude_difference < -math.pi:
+        longitude_difference += math.tau
+    return utils.BODY_RADIUS * math.hypot(
+        longitude_difference * cos_mean, latitude_difference
+    )
+
+
+def _bearing(longitude_difference, sin1, cos1, sin2, cos2):
+    """Calculate the initial bearing between two locations.
+
+    Args:
+        longitude_difference (float): Difference in longitude, in radians
+        sin1 (float): Sine of the first location’s latitude
+        cos1 (float): Cosine of the first location’s latitude
+        sin2 (float): Sine of the second location’s latitude
+        cos2 (float): Cosine of the second location’s latitude
+
+    Returns:
+        float: Positive North-aligned bearing in degrees
+    """
+    y = math.sin(longitude_difference) * cos2
+    x = cos1 * sin2 - sin1 * cos2 * math.cos(longitude_difference)
+    # Always return positive North-aligned bearing.  The shifted value is in
+    # [180, 540], so a compare and subtract gives the same result as modulo.
+    bearing = math.atan2(y, x) * _RAD2DEG + 360
+    if bearing >= 360:
+        bearing -= 360
+    return bearing
+
+
+def _reverse_bearing(bearing):
+    """Reverse a bearing.
+
+    Args:
+        bearing (float): Bearing in degrees, in the range [0, 360)
+
+    Returns:
+        float: Opposite bearing in degrees
+    """
+    bearing += 180
+    if bearing >= 360:
+        bearing -= 360
+    return bearing
+
+
+def _midpoint(rad_longitude, longitude_difference, sin1, cos1, sin2, cos2):
+    """Calculate the great circle midpoint between two locations.
+
+    Args:
+        rad_longitude (float): First location’s longitude, in radians
+        longitude_difference (float): Difference in longitude, in radians
+        sin1 (float): Sine of the first location’s latitude
+        cos1 (float): Cosine of the first location’s latitude
+        sin2 (float): Sine of the second location’s latitude
+        cos2 (float): Cosine of the second location’s latitude
+
+    Returns:
+        tuple of float: Midpoint’s latitude and longitude in radians
+    """
+    y = math.sin(longitude_difference) * cos2
+    x = cos2 * math.cos(longitude_difference)
+    denominator = cos1 + x
+    latitude = math.atan2(
+        sin1 + sin2, math.sqrt(denominator * denominator + y * y)
+    )
+    longitude = rad_longitude + math.atan2(y, denominator)
+    return latitude, longitude
+
+
+def _destination(
+    rad_longitude,
+    sin_lat,
+    cos_lat,
+    sin_bearing,
+    cos_bearing,
+    sin_distance,
+    cos_distance,
+):
+    """Calculate the destination given a bearing and angular distance.
+
+    Args:
+        rad_longitude (float): Starting longitude, in radians
+        sin_lat (float): Sine of the starting latitude
+        cos_lat (float): Cosine of the starting latitude
+        sin_bearing (float): Sine of the bearing
+        cos_bearing (float): Cosine of the bearing
+        sin_distance (float): Sine of the angular distance travelled
+        cos_distance (float): Cosine of the angular distance travelled
+
+    Returns:
+        tuple of float: Destination’s latitude and longitude in radians
+    """
+    dest_latitude = math.asin(
+        sin_lat * cos_distance + cos_lat * sin_distance * cos_bearing
+    )
+    dest_longitude = rad_longitude + math.atan2(
+        sin_bearing * sin_distance * cos_lat,
+        cos_distance - sin_lat * math.sin(dest_latitude),
+    )
+    return dest_latitude, dest_longitude
+
+
+@lru_cache(maxsize=1024)
+def _parse_location(location):
+    """Parse a location string, falling back to Maidenhead locators.
+
+    Imported data often repeats locations, and the parsed coordinates are
+    immutable, so results are cached.
+
+    Args:
+        location (str): Location identifier
+
+    Returns:
+        tuple of float: Latitude and longitude of location
+    """
+    return utils.parse_location(location) or utils.from_grid_locator(
+        location
+    )
+
+
+def _radians_point(latitude, longitude):
+    """Create a default ``Point`` from calculated coordinates in radians.
+
+    This skips the argument handling in :meth:`Point.__init__`, which
+    dominates the cost of building results in geodesic calculations.  The
+    location is still validated.
+
+    Args:
+        latitude (float): Location’s latitude, in radians
+        longitude (float): Location’s longitude, in radians
+
+    Returns:
+        Point: Location with metric units and no timezone offset
+
+    Raises:
+        ValueError: Invalid value for ``latitude`` or ``longitude``
+    """
+    point = Point.__new__(Point)
+    point._angle = 'radians'
+    point._set_location('latitude', latitude)
+    point._set_location('longitude', longitude)
+    point._units, point._unit_scale = 'metric', 1
+    point.timezone = 0
+    return point
+
+
+def _trig_rows(points):
+    """Extract coordinates, and their trigonometric values, for batch use.
+
+    Args:
+        points (list of Point): Locations to extract data from
+
+    Returns:
+        list of tuple of float: Latitude and longitude in radians, along with
+            the sine and cosine of the latitude for each location
+    """
+    # The attributes are read directly, as the managed properties’ getters
+    # are several times slower when extracting data for large collections
+    return [
+        (
+            point._rad_latitude,
+            point._rad_longitude,
+            point._sin_lat,
+            point._cos_lat,
+        )
+        for point in points
+    ]
+
+
+def _batch_distance(points, method='haversine'):
+    """Calculate distances between consecutive locations.
+
+    See also:
+        Point.distance
+
+    Args:
+        points (list of Point): Locations to calculate distances between
+        method (str): Method used to calculate distance
+
+    Returns:
+        list of float: Distance between points in series
+
+    Raises:
+        ValueError: Unknown value for ``method``
+    """
+    if method not in ('haversine', 'sloc', 'equirectangular'):
+        raise ValueError(f'Unknown method type {method!r}')
+    rows = _trig_rows(points)
+    distances = []
+    for point, (lat1, lon1, sin1, cos1), (lat2, lon2, sin2, cos2) in zip(
+        points, rows, rows[1:]
+    ):
+        if method == 'haversine':
+            distance = _haversine(lat2 - lat1, lon2 - lon1, cos1, cos2)
+        elif method == 'sloc':
+            distance = _sloc(lon2 - lon1, sin1, cos1, sin2, cos2)
+        else:
+            distance = _equirectangular(
+                lat2 - lat1, lon2 - lon1, math.cos((lat1 + lat2) / 2)
+            )
+        distances.append(distance / point._unit_scale)
+    return distances
+
+
+def _batch_bearing(points, format='numeric', final=False):
+    """Calculate bearings between consecutive locations.
+
+    See also:
+        Point.bearing, Point.final_bearing
+
+    Args:
+        points (list of Point): Locations to calculate bearings between
+        format (str): Format of the bearing string to return
+        final (bool): Calculate final bearings, instead of initial bearings
+
+    Returns:
+        list of float: Bearing between points in series
+
+    Raises:
+        ValueError: Unknown value for ``format``
+    """
+    if format not in ('numeric', 'string'):
+        raise ValueError(f'Unknown format type {format!r}')
+    rows = _trig_rows(points)
+    bearings = []
+    for (_, lon1, sin1, cos1), (_, lon2, sin2, cos2) in zip(rows, rows[1:]):
+        if final:
+            # Final bearings reverse the initial bearing from the end
+            bearing = _reverse_bearing(
+                _bearing(lon1 - lon2, sin2, cos2, sin1, cos1)
+            )
+        else:
+            bearing = _bearing(lon2 - lon1, sin1, cos1, sin2, cos2)
+        if format == 'string':
+            bearing = utils.angle_to_name(bearing)
+        bearings.append(bearing)
+    return bearings
+
+
+def _batch_inverse(points):
+    """Calculate bearings and distances between consecutive locations.
+
+    This fuses :func:`_batch_bearing` and :func:`_batch_distance`, so that
+    location data is only extracted once.
+
+    See also:
+        Point.inverse
+
+    Args:
+        points (list of Point): Locations to calculate inverse geodesics for
+
+    Returns:
+        list of 2-tuple of float: Bearing and distance between points in series
+    """
+    rows = _trig_rows(points)
+    inverses = []
+    for point, (lat1, lon1, sin1, cos1), (lat2, lon2, sin2, cos2) in zip(
+        points, rows, rows[1:]
+    ):
+        longitude_difference = lon2 - lon1
+        inverses.append(
+            (
+                _bearing(longitude_difference, sin1, cos1, sin2, cos2),
+                _haversine(lat2 - lat1, longitude_difference, cos1, cos2)
+                / point._unit_scale,
+            )
+        )
+    return inverses
+
+
+def _batch_midpoint(points):
+    """Calculate midpoints between consecutive locations.
+
+    See also:
+        Point.midpoint
+
+    Args:
+        points (list of Point): Locations to calculate midpoints between
+
+    Returns:
+        list of Point: Midpoint between points in series
+    """
+    rows = _trig_rows(points)
+    midpoints = []
+    for (_, lon1, sin1, cos1), (_, lon2, sin2, cos2) in zip(rows, rows[1:]):
+        latitude, longitude = _midpoint(
+            lon1, lon2 - lon1, sin1, cos1, sin2, cos2
+        )
+        midpoints.append(_radians_point(latitude, longitude))
+    return midpoints
+
+
+def _batch_destination(points, bearing, distance):
+    """Calculate destinations for locations given a bearing and distance.
+
+    The bearing’s sine and cosine are only calculated once, as are those of
+    the angular distance for each unit type in use.
+
+    See also:
+        Point.destination
+
+    Args:
+        points (list of Point): Locations to start from
+        bearing (float): Bearing to move on in degrees
+        distance (float): Distance, in each location’s ``units``
+
+    Returns:
+        list of Point: Locations after travelling ``distance`` along
+            ``bearing``
+    """
+    bearing *= _DEG2RAD
+    sin_bearing = math.sin(bearing)
+    cos_bearing = math.cos(bearing)
+    distances = {}
+    destinations = []
+    for point in points:
+        scale = point._unit_scale
+        if scale not in distances:
+            angular_distance = distance * scale / utils.BODY_RADIUS
+            distances[scale] = (
+                math.sin(angular_distance),
+                math.cos(angular_distance),
+            )
+        latitude, longitude = _destination(
+            point._rad_longitude,
+            point._sin_lat,
+            point._cos_lat,
+            sin_bearing,
+            cos_bearing,
+            *distances[scale],
+        )
+        destinations.append(_radians_point(latitude, longitude))
+    return destinations
+
+
+def _pairwise_haversine(points, others):
+    """Calculate haversine distances between every pair from two sets.
+
+    The sines of the half coordinate differences are expanded with angle
+    difference identities, which means every trigonometric value is
+    calculated once per location instead of once per pair.
+
+    See also:
+        Point.distance
+
+    Args:
+        points (list of Point): Locations to calculate distances from
+        others (list of Point): Locations to calculate distances to
+
+    Returns:
+        list of list of float: Distances from each of ``points`` to every
+            location in ``others``, in the location’s ``units``
+    """
+
+    def halves(point):
+        latitude = point._rad_latitude / 2
+        longitude = point._rad_longitude / 2
+        return (
+            math.sin(latitude),
+            math.cos(latitude),
+            math.sin(longitude),
+            math.cos(longitude),
+            point._cos_lat,
+        )
+
+    diameter = 2 * utils.BODY_RADIUS
+    columns = list(map(halves, others))
+    distances = []
+    for point in points:
+        sin_lat, cos_lat, sin_lon, cos_lon, cos1 = halves(point)
+        scale = point._unit_scale
+        row = []
+        for sin_lat2, cos_lat2, sin_lon2, cos_lon2, cos2 in columns:
+            sin_latitude = sin_lat2 * cos_lat - cos_lat2 * sin_lat
+            sin_longitude = sin_lon2 * cos_lon - cos_lon2 * sin_lon
+            temp = sin_latitude * sin_latitude + cos1 * cos2 * (
+                sin_longitude * sin_longitude
+            )
+            # The expansion can round past 1 for near antipodal locations
+            temp = min(temp, 1.0)
+            row.append(diameter * math.asin(math.sqrt(temp)) / scale)
+        distances.append(row)
+    return distances
+
+
+def _pairwise_sloc(points, others):
+    """Calculate law of cosines distances between every pair from two sets.
+
+    The cosine of the longitude difference is expanded with the angle
+    difference identity, which means every trigonometric value is calculated
+    once per location instead of once per pair.
+
+    See also:
+        Point.distance
+
+    Args:
+        points (list of Point): Locations to calculate distances from
+        others (list of Point): Locations to calculate distances to
+
+    Returns:
+        list of list of float: Distances from each of ``points`` to every
+            location in ``others``, in the location’s ``units``
+    """
+
+    def trig(point):
+        return (
+            point._sin_lat,
+            point._cos_lat,
+            math.sin(point._rad_longitude),
+            math.cos(point._rad_longitude),
+        )
+
+    columns = list(map(trig, others))
+    distances = []
+    for point in points:
+        sin1, cos1, sin_lon, cos_lon = trig(point)
+        scale = point._unit_scale
+        row = []
+        for sin2, cos2, sin_lon2, cos_lon2 in columns:
+            cos_angle = sin1 * sin2 + cos1 * cos2 * (
+                cos_lon2 * cos_lon + sin_lon2 * sin_lon
+            )
+            # Rounding can push the cosine outside [-1, 1] for identical or
+            # antipodal locations
+            cos_angle = max(-1.0, min(cos_angle, 1.0))
+            row.append(math.acos(cos_angle) * utils.BODY_RADIUS / scale)
+        distances.append(row)
+    return distances
+
+
+def _pairwise_equirectangular(points, others):
+    """Calculate equirectangular distances between every pair from two sets.
+
+    The cosine of the mean latitude is expanded with the angle sum identity,
+    which means every trigonometric value is calculated once per location
+    instead of once per pair.
+
+    See also:
+        Point.distance
+
+    Args:
+        points (list of Point): Locations to calculate distances from
+        others (list of Point): Locations to calculate distances to
+
+    Returns:
+        list of list of float: Distances from each of ``points`` to every
+            location in ``others``, in the location’s ``units``
+    """
+
+    def halves(point):
+        latitude = point._rad_latitude / 2
+        return (
+            point._rad_latitude,
+            point._rad_longitude,
+            math.sin(latitude),
+            math.cos(latitude),
+        )
+
+    columns = list(map(halves, others))
+    distances = []
+    for point in points:
+        lat1, lon1, sin_lat, cos_lat = halves(point)
+        scale = point._unit_scale
+        distances.append(
+            [
+                _equirectangular(
+                    lat2 - lat1,
+                    lon2 - lon1,
+                    cos_lat2 * cos_lat - sin_lat2 * sin_lat,
+                )
+                / scale
+                for lat2, lon2, sin_lat2, cos_lat2 in columns
+            ]
+        )
+    return distances
+
+
+def _batch_in_range(location, points, distance):
+    """Test whether locations are within a given range of ``location``.
+
+    See also:
+        Point.distance
+
+    Args:
+        location (Point): Location to test range against
+        points (list of Point): Locations to test
+        distance (float): Distance, in ``location.units``, to test within
+
+    Returns:
+        list of bool: Whether each of ``points`` is within range
+    """
+    divisor = location._unit_scale
+    rad_latitude = location._rad_latitude
+    rad_longitude = location._rad_longitude
+    cos_lat = location._cos_lat
+    # A great circle path is never shorter than the difference in latitude,
+    # so locations outside of the latitude band can be rejected without any
+    # trigonometry.  The band is widened slightly, so that rounding can’t
+    # reject a location that the full calculation would accept.
+    band = distance * divisor / utils.BODY_RADIUS * (1 + 1e-9)
+    return [
+        abs(point._rad_latitude - rad_latitude) <= band
+        and _haversine(
+            point._rad_latitude - rad_latitude,
+            point._rad_longitude - rad_longitude,
+            cos_lat,
+            point._cos_lat,
+        )
+        / divisor
+        < distance
+        for point in points
+    ]
+
+
+def _batch_sun_rise_set(points, date, zenith, mode):
+    """Calculate sunrise or sunset times for locations.
+
+    The date, zenith and mode arguments are only resolved once, and the
+    locations’ cached latitude sines and cosines are reused.
+
+    See also:
+        utils.sun_rise_set
+
+    Args:
+        points (list of Point): Locations to calculate event times for
+        date (datetime.date): Calculate rise or set for given date
+        zenith (str): Calculate rise/set events, or twilight times
+        mode (str): Which time to calculate
+
+    Returns:
+        list of datetime.time: The time for the given event for each location
+    """
+    n, zenith = utils._sun_arguments(date, zenith)
+    rising = utils._is_sunrise(mode)
+    return [
+        utils._sun_rise_set(
+            n,
+            point._longitude,
+            point._sin_lat,
+            point._cos_lat,
+            rising,
+            point.timezone,
+            zenith,
+        )
+        for point in points
+    ]
+
+
+def _batch_sun_events(points, date, zenith):
+    """Calculate sunrise and sunset times for locations.
+
+    See also:
+        utils.sun_events
+
+    Args:
+        points (list of Point): Locations to calculate event times for
+        date (datetime.date): Calculate rise or set for given date
+        zenith (str): Calculate rise/set events, or twilight times
+
+    Returns:
+        list of 2-tuple of datetime.time: The time for the sunrise and sunset
+            events for each location
+    """
+    n, zenith = utils._sun_arguments(date, zenith)
+    return [
+        utils._sun_events(
+            n,
+            point._longitude,
+            point._sin_lat,
+            point._cos_lat,
+            point.timezone,
+            zenith,
+        )
+        for point in points
+    ]
+
+
+def _batch_grid_locator(points, precision):
+    """Calculate Maidenhead locators for locations.
+
+    The precision is checked once, and as a ``Point``’s location is
+    validated on assignment the per-location checks are skipped.
+
+    See also:
+        utils.to_grid_locator
+
+    Args:
+        points (list of Point): Locations to calculate locators for
+        precision (str): Precision with which generate locator string
+
+    Returns:
+        list of str: Maidenhead locator for each location
+
+    Raises:
+        ValueError: Invalid precision identifier
+    """
+    if precision not in ('square', 'subsquare', 'extsquare'):
+        raise ValueError(f'Unsupported precision value {precision!r}')
+    return [
+        utils._grid_locator(point._latitude, point._longitude, precision)
+        for point in points
+    ]
 
 
 class Point:
@@ -94,17 +765,7 @@ class Point:
             raise ValueError(f'Unknown angle type {angle!r}')
         self._set_location('latitude', latitude)
         self._set_location('longitude', longitude)
-
-        if units in ('imperial', 'metric', 'nautical'):
-            self.units = units
-        elif units == 'km':
-            self.units = 'metric'
-        elif units in ('US customary', 'sm'):
-            self.units = 'imperial'
-        elif units == 'nm':
-            self.units = 'nautical'
-        else:
-            raise ValueError(f'Unknown units type {units!r}')
+        self.units = units
         self.timezone = timezone
 
     def _set_location(self, ltype, value):
@@ -112,22 +773,50 @@ class Point:
         if self._angle == 'degrees':
             if isinstance(value, (tuple, list)):
                 value = utils.to_dd(*value)
-            setattr(self, '_%s' % ltype, float(value))
-            setattr(self, '_rad_%s' % ltype, math.radians(float(value)))
+            degrees = float(value)
+            radians = degrees * _DEG2RAD
         elif self._angle == 'radians':
-            setattr(self, '_rad_%s' % ltype, float(value))
-            setattr(self, '_%s' % ltype, math.degrees(float(value)))
+            radians = float(value)
+            degrees = radians * _RAD2DEG
         else:
             raise ValueError(f'Unknown angle type {self._angle!r}')
-        if ltype == 'latitude' and not -90 <= self._latitude <= 90:
-            raise ValueError(f'Invalid latitude value {value!r}')
-        elif ltype == 'longitude' and not -180 <= self._longitude <= 180:
-            raise ValueError(f'Invalid longitude value {value!r}')
+        # Values are checked before storing, so a failed update leaves the
+        # object untouched
+        if ltype == 'latitude':
+            if not -90 <= degrees <= 90:
+                raise ValueError(f'Invalid latitude value {value!r}')
+            self._latitude = degrees
+            self._rad_latitude = radians
+            # Cached for geodesic calculations, which all need them
+            self._sin_lat = math.sin(radians)
+            self._cos_lat = math.cos(radians)
+        else:
+            if not -180 <= degrees <= 180:
+                raise ValueError(f'Invalid longitude value {value!r}')
+            self._longitude = degrees
+            self._rad_longitude = radians
+        self._hash = self._format_cache = None
 
     latitude = _manage_location('latitude')
     longitude = _manage_location('longitude')
-    rad_latitude = _manage_location('rad_latitude')
-    rad_longitude = _manage_location('rad_longitude')
+    rad_latitude = property(attrgetter('_rad_latitude'))
+    rad_longitude = property(attrgetter('_rad_longitude'))
+
+    @property
+    def units(self):
+        """Units type to be used for distances.
+
+        Setting the units also caches the divisor used to convert distances
+        from kilometres.
+
+        Raises:
+            ValueError: Unknown value for ``units``
+        """
+        return self._units
+
+    @units.setter
+    def units(self, value):
+        self._units, self._unit_scale = utils._resolve_units(value)
 
     def __repr__(self):
         """Self-documenting string representation.
@@ -165,22 +854,28 @@ class Point:
         Raises:
             ValueError: Unknown value for ``format_spec``
         """
-        text = []
         if not format_spec:  # default format calls set format_spec to ''
             format_spec = 'dd'
+        # Formatted strings are cached until the location is changed
+        cache = self._format_cache
+        if cache is None:
+            cache = self._format_cache = {}
+        elif format_spec in cache:
+            return cache[format_spec]
         if format_spec == 'dd':
-            text.append('S' if self.latitude < 0 else 'N')
-            text.append('%06.3f°; ' % abs(self.latitude))
-            text.append('W' if self.longitude < 0 else 'E')
-            text.append('%07.3f°' % abs(self.longitude))
+            latitude, longitude = self._latitude, self._longitude
+            text = (
+                f"{'S' if latitude < 0 else 'N'}{abs(latitude):06.3f}°; "
+                f"{'W' if longitude < 0 else 'E'}{abs(longitude):07.3f}°"
+            )
         elif format_spec in ('dm', 'dms'):
-            text = _dms_formatter(self.latitude, self.longitude, format_spec)
+            text = _dms_formatter(self._latitude, self._longitude, format_spec)
         elif format_spec == 'locator':
-            text.append(self.to_grid_locator())
+            text = self.to_grid_locator()
         else:
             raise ValueError(f'Unknown format_spec {format_spec!r}')
-
-        return ''.join(text)
+        cache[format_spec] = text
+        return text
 
     def __eq__(self, other, accuracy=None):
         """Compare ``Point`` objects for equality with optional accuracy amount.
@@ -194,7 +889,17 @@ class Point:
             bool: True if objects are equal within given bounds
         """
         if accuracy is None:
-            return hash(self) == hash(other)
+            # Locations differing in position can be rejected without building
+            # representations, which otherwise must match
+            if isinstance(other, Point) and (
+                self._latitude != other._latitude
+                or self._longitude != other._longitude
+            ):
+                return False
+            # Objects also compare equal to the string of their representation
+            if not isinstance(other, str):
+                other = repr(other)
+            return repr(self) == other
         else:
             return self.distance(other) < accuracy
 
@@ -214,17 +919,16 @@ class Point:
     def __hash__(self):
         """Produce an object hash for equality checks.
 
-        This method returns the hash of the return value from the ``__str__``
-        method.  It guarantees equality for objects that have the same latitude
-        and longitude.
-
-        See also:
-            __str__
+        This method returns the hash of the location’s latitude and longitude.
+        It guarantees equality for objects that have the same latitude and
+        longitude.  The result is cached until the location is changed.
 
         Returns:
-            int: Hash of string representation
+            int: Hash of location
         """
-        return hash(repr(self))
+        if self._hash is None:
+            self._hash = hash((self._latitude, self._longitude))
+        return self._hash
 
     def to_grid_locator(self, precision='square'):
         """Calculate Maidenhead locator from latitude and longitude.
@@ -235,7 +939,9 @@ class Point:
         Returns:
             str: Maidenhead locator for latitude and longitude
         """
-        return utils.to_grid_locator(self.latitude, self.longitude, precision)
+        return utils.to_grid_locator(
+            self._latitude, self._longitude, precision
+        )
 
     def distance(self, other, method='haversine'):
         """Calculate the distance from self to other.
@@ -245,6 +951,10 @@ class Point:
         Los Angeles International Airport, and is correct to within
         2 kilometres of the calculation there.
 
+        The ``equirectangular`` method is a cheaper approximation, which is
+        only suitable for short distances such as those between successive
+        track points.
+
         Args:
             other (Point): Location to calculate distance to
             method (str): Method used to calculate distance
@@ -258,40 +968,33 @@ class Point:
         .. _Great-circle distance entry:
            http://en.wikipedia.org/wiki/Great-circle_distance
         """
-        longitude_difference = other.rad_longitude - self.rad_longitude
-        latitude_difference = other.rad_latitude - self.rad_latitude
+        longitude_difference = other._rad_longitude - self._rad_longitude
 
         if method == 'haversine':
-            temp = (
-                math.sin(latitude_difference / 2) ** 2
-                + math.cos(self.rad_latitude)
-                * math.cos(other.rad_latitude)
-                * math.sin(longitude_difference / 2) ** 2
-            )
-            distance = (
-                2
-                * utils.BODY_RADIUS
-                * math.atan2(math.sqrt(temp), math.sqrt(1 - temp))
+            distance = _haversine(
+                other._rad_latitude - self._rad_latitude,
+                longitude_difference,
+                self._cos_lat,
+                other._cos_lat,
             )
         elif method == 'sloc':
-            distance = (
-                math.acos(
-                    math.sin(self.rad_latitude) * math.sin(other.rad_latitude)
-                    + math.cos(self.rad_latitude)
-                    * math.cos(other.rad_latitude)
-                    * math.cos(longitude_difference)
-                )
-                * utils.BODY_RADIUS
+            distance = _sloc(
+                longitude_difference,
+                self._sin_lat,
+                self._cos_lat,
+                other._sin_lat,
+                other._cos_lat,
+            )
+        elif method == 'equirectangular':
+            distance = _equirectangular(
+                other._rad_latitude - self._rad_latitude,
+                longitude_difference,
+                math.cos((self._rad_latitude + other._rad_latitude) / 2),
             )
         else:
             raise ValueError(f'Unknown method type {method!r}')
 
-        if self.units == 'imperial':
-            return distance / utils.STATUTE_MILE
-        elif self.units == 'nautical':
-            return distance / utils.NAUTICAL_MILE
-        else:
-            return distance
+        return distance / self._unit_scale
 
     def bearing(self, other, format='numeric'):
         """Calculate the initial bearing from self to other.
@@ -316,19 +1019,13 @@ class Point:
         Raises:
             ValueError: Unknown value for ``format``
         """
-        longitude_difference = other.rad_longitude - self.rad_longitude
-
-        y = math.sin(longitude_difference) * math.cos(other.rad_latitude)
-        x = math.cos(self.rad_latitude) * math.sin(
-            other.rad_latitude
-        ) - math.sin(self.rad_latitude) * math.cos(
-            other.rad_latitude
-        ) * math.cos(
-            longitude_difference
+        bearing = _bearing(
+            other._rad_longitude - self._rad_longitude,
+            self._sin_lat,
+            self._cos_lat,
+            other._sin_lat,
+            other._cos_lat,
         )
-        bearing = math.degrees(math.atan2(y, x))
-        # Always return positive North-aligned bearing
-        bearing = (bearing + 360) % 360
         if format == 'numeric':
             return bearing
         elif format == 'string':
@@ -348,18 +1045,16 @@ class Point:
         Returns:
             Point: Great circle midpoint from self to other
         """
-        longitude_difference = other.rad_longitude - self.rad_longitude
-        y = math.sin(longitude_difference) * math.cos(other.rad_latitude)
-        x = math.cos(other.rad_latitude) * math.cos(longitude_difference)
-        latitude = math.atan2(
-            math.sin(self.rad_latitude) + math.sin(other.rad_latitude),
-            math.sqrt((math.cos(self.rad_latitude) + x) ** 2 + y ** 2),
-        )
-        longitude = self.rad_longitude + math.atan2(
-            y, math.cos(self.rad_latitude) + x
+        latitude, longitude = _midpoint(
+            self._rad_longitude,
+            other._rad_longitude - self._rad_longitude,
+            self._sin_lat,
+            self._cos_lat,
+            other._sin_lat,
+            other._cos_lat,
         )
 
-        return Point(latitude, longitude, angle='radians')
+        return _radians_point(latitude, longitude)
 
     def final_bearing(self, other, format='numeric'):
         """Calculate the final bearing from self to other.
@@ -377,7 +1072,15 @@ class Point:
         Raises:
             ValueError: Unknown value for ``format``
         """
-        final_bearing = (other.bearing(self) + 180) % 360
+        final_bearing = _reverse_bearing(
+            _bearing(
+                self._rad_longitude - other._rad_longitude,
+                other._sin_lat,
+                other._cos_lat,
+                self._sin_lat,
+                self._cos_lat,
+            )
+        )
         if format == 'numeric':
             return final_bearing
         elif format == 'string':
@@ -395,30 +1098,20 @@ class Point:
         Returns:
             Point: Location after travelling ``distance`` along ``bearing``
         """
-        bearing = math.radians(bearing)
-
-        if self.units == 'imperial':
-            distance *= utils.STATUTE_MILE
-        elif self.units == 'nautical':
-            distance *= utils.NAUTICAL_MILE
-
-        angular_distance = distance / utils.BODY_RADIUS
-
-        dest_latitude = math.asin(
-            math.sin(self.rad_latitude) * math.cos(angular_distance)
-            + math.cos(self.rad_latitude)
-            * math.sin(angular_distance)
-            * math.cos(bearing)
-        )
-        dest_longitude = self.rad_longitude + math.atan2(
-            math.sin(bearing)
-            * math.sin(angular_distance)
-            * math.cos(self.rad_latitude),
-            math.cos(angular_distance)
-            - math.sin(self.rad_latitude) * math.sin(dest_latitude),
+        bearing *= _DEG2RAD
+
+        angular_distance = distance * self._unit_scale / utils.BODY_RADIUS
+        dest_latitude, dest_longitude = _destination(
+            self._rad_longitude,
+            self._sin_lat,
+            self._cos_lat,
+            math.sin(bearing),
+            math.cos(bearing),
+            math.sin(angular_distance),
+            math.cos(angular_distance),
         )
 
-        return Point(dest_latitude, dest_longitude, angle='radians')
+        return _radians_point(dest_latitude, dest_longitude)
 
     def sunrise(self, date=None, zenith=None):
         """Calculate the sunrise time for a ``Point`` object.
@@ -434,8 +1127,15 @@ class Point:
             datetime.datetime: The time for the given event in the specified
                 timezone
         """
-        return utils.sun_rise_set(
-            self.latitude, self.longitude, date, 'rise', self.timezone, zenith
+        n, zenith = utils._sun_arguments(date, zenith)
+        return utils._sun_rise_set(
+            n,
+            self._longitude,
+            self._sin_lat,
+            self._cos_lat,
+            True,
+            self.timezone,
+            zenith,
         )
 
     def sunset(self, date=None, zenith=None):
@@ -452,8 +1152,15 @@ class Point:
             datetime.datetime: The time for the given event in the specified
                 timezone
         """
-        return utils.sun_rise_set(
-            self.latitude, self.longitude, date, 'set', self.timezone, zenith
+        n, zenith = utils._sun_arguments(date, zenith)
+        return utils._sun_rise_set(
+            n,
+            self._longitude,
+            self._sin_lat,
+            self._cos_lat,
+            False,
+            self.timezone,
+            zenith,
         )
 
     def sun_events(self, date=None, zenith=None):
@@ -470,8 +1177,14 @@ class Point:
             tuple of datetime.datetime: The time for the given events in the
                 specified timezone
         """
-        return utils.sun_events(
-            self.latitude, self.longitude, date, self.timezone, zenith
+        n, zenith = utils._sun_arguments(date, zenith)
+        return utils._sun_events(
+            n,
+            self._longitude,
+            self._sin_lat,
+            self._cos_lat,
+            self.timezone,
+            zenith,
         )
 
     # Inverse and forward are the common functions expected by people that are
@@ -485,7 +1198,25 @@ class Point:
         Returns:
             tuple of float objects: Bearing and distance from self to other
         """
-        return (self.bearing(other), self.distance(other))
+        # Share the longitude difference and cached latitude values between
+        # the two calculations, as _batch_inverse does for collections
+        longitude_difference = other._rad_longitude - self._rad_longitude
+        return (
+            _bearing(
+                longitude_difference,
+                self._sin_lat,
+                self._cos_lat,
+                other._sin_lat,
+                other._cos_lat,
+            ),
+            _haversine(
+                other._rad_latitude - self._rad_latitude,
+                longitude_difference,
+                self._cos_lat,
+                other._cos_lat,
+            )
+            / self._unit_scale,
+        )
 
     # Forward geodesic function maps directly to destination method
     forward = destination
@@ -565,13 +1296,10 @@ class Points(list):
         Args:
             locations (list of str or tuple): Location identifiers
         """
-        for location in locations:
-            data = utils.parse_location(location)
-            if data:
-                latitude, longitude = data
-            else:
-                latitude, longitude = utils.from_grid_locator(location)
-            self.append(Point(latitude, longitude, self.units))
+        units = self.units
+        self.extend(
+            Point(*_parse_location(location), units) for location in locations
+        )
 
     def distance(self, method='haversine'):
         """Calculate distances between locations.
@@ -584,9 +1312,37 @@ class Points(list):
         """
         if not len(self) > 1:
             raise RuntimeError('More than one location is required')
-        return (
-            self[i].distance(self[i + 1], method) for i in range(len(self) - 1)
-        )
+        return _batch_distance(self, method)
+
+    def pairwise_distance(self, other, method='haversine'):
+        """Calculate distances between every location and those in another set.
+
+        Note:
+           The coordinate differences are expanded with angle difference
+           identities, so results may differ from :meth:`Point.distance`.
+           The difference is normally in the last few places, but can reach
+           a fraction of a metre for identical or antipodal locations where
+           the formulae are ill-conditioned.
+
+        Args:
+            other (list of Point): Locations to calculate distances to
+            method (str): Method used to calculate distance
+
+        Returns:
+            list of list of float: Distances from each location to every
+                location in ``other``, in the location’s ``units``
+
+        Raises:
+            ValueError: Unknown value for ``method``
+        """
+        if method == 'haversine':
+            return _pairwise_haversine(self, other)
+        elif method == 'sloc':
+            return _pairwise_sloc(self, other)
+        elif method == 'equirectangular':
+            return _pairwise_equirectangular(self, other)
+        else:
+            raise ValueError(f'Unknown method type {method!r}')
 
     def bearing(self, format='numeric'):
         """Calculate bearing between locations.
@@ -599,9 +1355,7 @@ class Points(list):
         """
         if not len(self) > 1:
             raise RuntimeError('More than one location is required')
-        return (
-            self[i].bearing(self[i + 1], format) for i in range(len(self) - 1)
-        )
+        return _batch_bearing(self, format)
 
     def final_bearing(self, format='numeric'):
         """Calculate final bearing between locations.
@@ -614,10 +1368,7 @@ class Points(list):
         """
         if len(self) == 1:
             raise RuntimeError('More than one location is required')
-        return (
-            self[i].final_bearing(self[i + 1], format)
-            for i in range(len(self) - 1)
-        )
+        return _batch_bearing(self, format, final=True)
 
     def inverse(self):
         """Calculate the inverse geodesic between locations.
@@ -626,10 +1377,7 @@ class Points(list):
             list of 2-tuple of float: Bearing and distance between points in
                 series
         """
-        return (
-            (self[i].bearing(self[i + 1]), self[i].distance(self[i + 1]))
-            for i in range(len(self) - 1)
-        )
+        return _batch_inverse(self)
 
     def midpoint(self):
         """Calculate the midpoint between locations.
@@ -637,7 +1385,7 @@ class Points(list):
         Returns:
             list of Point: Midpoint between points in series
         """
-        return (self[i].midpoint(self[i + 1]) for i in range(len(self) - 1))
+        return _batch_midpoint(self)
 
     def range(self, location, distance):
         """Test whether locations are within a given range of ``location``.
@@ -649,7 +1397,7 @@ class Points(list):
         Returns:
             list of Point: Points within range of the specified location
         """
-        return (x for x in self if location.__eq__(x, distance))
+        return list(compress(self, _batch_in_range(location, self, distance)))
 
     def destination(self, bearing, distance):
         """Calculate destination locations for given distance and bearings.
@@ -661,7 +1409,7 @@ class Points(list):
         Returns:
             list of Point: Points shifted by ``distance`` and ``bearing``
         """
-        return (x.destination(bearing, distance) for x in self)
+        return _batch_destination(self, bearing, distance)
 
     forward = destination
 
@@ -675,7 +1423,7 @@ class Points(list):
         Returns:
             list of datetime.datetime: The time for the sunrise for each point
         """
-        return (x.sunrise(date, zenith) for x in self)
+        return _batch_sun_rise_set(self, date, zenith, 'rise')
 
     def sunset(self, date=None, zenith=None):
         """Calculate sunset times for locations.
@@ -687,7 +1435,7 @@ class Points(list):
         Returns:
             list of datetime.datetime: The time for the sunset for each point
         """
-        return (x.sunset(date, zenith) for x in self)
+        return _batch_sun_rise_set(self, date, zenith, 'set')
 
     def sun_events(self, date=None, zenith=None):
         """Calculate sunrise/sunset times for locations.
@@ -700,7 +1448,7 @@ class Points(list):
             list of 2-tuple of datetime.datetime: The time for the sunrise and
                 sunset events for each point
         """
-        return (x.sun_events(date, zenith) for x in self)
+        return _batch_sun_events(self, date, zenith)
 
     def to_grid_locator(self, precision='square'):
         """Calculate Maidenhead locator for locations.
@@ -711,7 +1459,7 @@ class Points(list):
         Returns:
             list of str: Maidenhead locator for each point
         """
-        return (x.to_grid_locator(precision) for x in self)
+        return _batch_grid_locator(self, precision)
 
 
 class TimedPoints(Points):
@@ -730,10 +1478,10 @@ class TimedPoints(Points):
                 'Not all Point objects include time ' 'attribute'
             )
 
-        return (
-            distance / ((times[i + 1] - times[i]).seconds / 3600)
-            for i, distance in enumerate(self.distance())
-        )
+        return [
+            distance / ((end - start).seconds / 3600)
+            for distance, start, end in zip(self.distance(), times, times[1:])
+        ]
 
 
 class KeyedPoints(dict):
@@ -779,13 +1527,11 @@ class KeyedPoints(dict):
         Args:
             locations (list of 2-tuple of str): Identifiers and locations
         """
-        for identifier, location in locations:
-            data = utils.parse_location(location)
-            if data:
-                latitude, longitude = data
-            else:
-                latitude, longitude = utils.from_grid_locator(location)
-            self[identifier] = Point(latitude, longitude, self.units)
+        units = self.units
+        self.update(
+            (identifier, Point(*_parse_location(location), units))
+            for identifier, location in locations
+        )
 
     def distance(self, order, method='haversine'):
         """Calculate distances between locations.
@@ -799,10 +1545,8 @@ class KeyedPoints(dict):
         """
         if not len(self) > 1:
             raise RuntimeError('More than one location is required')
-        return (
-            self[order[i]].distance(self[order[i + 1]], method)
-            for i in range(len(order) - 1)
-        )
+        points = list(map(self.__getitem__, order))
+        return _batch_distance(points, method)
 
     def bearing(self, order, format='numeric'):
         """Calculate bearing between locations.
@@ -816,10 +1560,8 @@ class KeyedPoints(dict):
         """
         if not len(self) > 1:
             raise RuntimeError('More than one location is required')
-        return (
-            self[order[i]].bearing(self[order[i + 1]], format)
-            for i in range(len(order) - 1)
-        )
+        points = list(map(self.__getitem__, order))
+        return _batch_bearing(points, format)
 
     def final_bearing(self, order, format='numeric'):
         """Calculate final bearing between locations.
@@ -833,10 +1575,8 @@ class KeyedPoints(dict):
         """
         if len(self) == 1:
             raise RuntimeError('More than one location is required')
-        return (
-            self[order[i]].final_bearing(self[order[i + 1]], format)
-            for i in range(len(order) - 1)
-        )
+        points = list(map(self.__getitem__, order))
+        return _batch_bearing(points, format, final=True)
 
     def inverse(self, order):
         """Calculate the inverse geodesic between locations.
@@ -848,13 +1588,8 @@ class KeyedPoints(dict):
             list of 2-tuple of float: Bearing and distance between points in
                 series
         """
-        return (
-            (
-                self[order[i]].bearing(self[order[i + 1]]),
-                self[order[i]].distance(self[order[i + 1]]),
-            )
-            for i in range(len(order) - 1)
-        )
+        points = list(map(self.__getitem__, order))
+        return _batch_inverse(points)
 
     def midpoint(self, order):
         """Calculate the midpoint between locations.
@@ -865,10 +1600,8 @@ class KeyedPoints(dict):
         Returns:
             list of Point: Midpoint between points in series
         """
-        return (
-            self[order[i]].midpoint(self[order[i + 1]])
-            for i in range(len(order) - 1)
-        )
+        points = list(map(self.__getitem__, order))
+        return _batch_midpoint(points)
 
     def range(self, location, distance):
         """Test whether locations are within a given range of the first.
@@ -878,9 +1611,15 @@ class KeyedPoints(dict):
             distance (float): Distance to test location is within
 
         Returns:
-            list of Point: Objects within specified range
+            list of 2-tuple of str and Point: Identifiers and objects within
+                specified range
         """
-        return (x for x in self.items() if location.__eq__(x[1], distance))
+        return list(
+            compress(
+                self.items(),
+                _batch_in_range(location, list(self.values()), distance),
+            )
+        )
 
     def destination(self, bearing, distance):
         """Calculate destination locations for given distance and bearings.
@@ -888,9 +1627,13 @@ class KeyedPoints(dict):
         Args:
             bearing (float): Bearing to move on in degrees
             distance (float): Distance in kilometres
+
+        Returns:
+            list of 2-tuple of str and Point: Identifiers and destination
+                locations
         """
-        return (
-            (x[0], x[1].destination(bearing, distance)) for x in self.items()
+        return list(
+            zip(self, _batch_destination(self.values(), bearing, distance))
         )
 
     forward = destination
@@ -905,7 +1648,9 @@ class KeyedPoints(dict):
         Returns:
             list of datetime.datetime: The time for the sunrise for each point
         """
-        return ((x[0], x[1].sunrise(date, zenith)) for x in self.items())
+        return list(
+            zip(self, _batch_sun_rise_set(self.values(), date, zenith, 'rise'))
+        )
 
     def sunset(self, date=None, zenith=None):
         """Calculate sunset times for locations.
@@ -917,7 +1662,9 @@ class KeyedPoints(dict):
         Returns:
             list of datetime.datetime: The time for the sunset for each point
         """
-        return ((x[0], x[1].sunset(date, zenith)) for x in self.items())
+        return list(
+            zip(self, _batch_sun_rise_set(self.values(), date, zenith, 'set'))
+        )
 
     def sun_events(self, date=None, zenith=None):
         """Calculate sunrise/sunset times for locations.
@@ -930,7 +1677,7 @@ class KeyedPoints(dict):
             list of 2-tuple of datetime.datetime: The time for the sunrise and
                 sunset events for each point
         """
-        return ((x[0], x[1].sun_events(date, zenith)) for x in self.items())
+        return list(zip(self, _batch_sun_events(self.values(), date, zenith)))
 
     def to_grid_locator(self, precision='square'):
         """Calculate Maidenhead locator for locations.
@@ -941,4 +1688,4 @@ class KeyedPoints(dict):
         Returns:
             list of str: Maidenhead locator for each point
         """
-        return ((x[0], x[1].to_grid_locator(precision)) for x in self.items())
+        return list(zip(self, _batch_grid_locator(self.values(), precision)))
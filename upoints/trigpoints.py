@@ -18,11 +18,23 @@
 # You should have received a copy of the GNU General Public License along with
 # upoints.  If not, see <http://www.gnu.org/licenses/>.
 
-from functools import partial
-
 from . import point, utils
 
 
+def _parse_position(text, positive):
+    """Parse a hemisphere prefixed coordinate.
+
+    Args:
+        text (str): Coordinate with leading hemisphere letter
+        positive (str): Hemisphere letter denoting positive values
+
+    Returns:
+        float: Signed coordinate value
+    """
+    value = float(text[1:])
+    return value if text[0] == positive else 0 - value
+
+
 class Trigpoint(point.Point):
     """Class for representing a location from a trigpoint marker file.
 
@@ -140,40 +152,22 @@ class Trigpoints(point.KeyedPoints):
         .. _alltrigs-wgs84.txt: http://www.haroldstreet.org.uk/trigpoints/
         """
         self._marker_file = marker_file
-        field_names = (
-            'tag',
-            'identity',
-            'latitude',
-            'longitude',
-            'altitude',
-            'name',
-        )
-        pos_parse = (
-            lambda x, s: float(s[1:]) if s[0] == x else 0 - float(s[1:])
-        )
-        latitude_parse = partial(pos_parse, 'N')
-        longitude_parse = partial(pos_parse, 'E')
         # A value of 8888.0 denotes unavailable data
         altitude_parse = lambda s: None if s.strip() == '8888.0' else float(s)
-        field_parsers = (
-            str,
-            int,
-            latitude_parse,
-            longitude_parse,
-            altitude_parse,
-            str,
-        )
-
-        data = utils.prepare_csv_read(marker_file, field_names)
-
-        for row in (x for x in data if x['tag'] == 'W'):
-            for name, parser in zip(field_names, field_parsers):
-                row[name] = parser(row[name])
-            del row['tag']
-            try:
-                self[row['identity']] = Trigpoint(**row)
-            except TypeError:
-                # Workaround formatting error in 506514 entry that contains
-                # spurious comma
-                del row[None]
-                self[row['identity']] = Trigpoint(**row)
+
+        data = utils._prepare_csv_rows(marker_file)
+
+        for row in data:
+            if not row or row[0] != 'W':
+                continue
+            # Any spurious trailing fields, such as the formatting error in
+            # the 506514 entry, are ignored
+            identity, latitude, longitude, altitude, name = row[1:6]
+            identity = int(identity)
+            self[identity] = Trigpoint(
+                _parse_position(latitude, 'N'),
+                _parse_position(longitude, 'E'),
+                altitude_parse(altitude),
+                name,
+                identity,
+            )
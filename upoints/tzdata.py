@@ -124,14 +124,20 @@ class Zones(point.Points):
         .. _standard distribution site: ftp://elsie.nci.nih.gov/pub/
         """
         self._zone_file = zone_file
-        field_names = ('country', 'location', 'zone', 'comments')
-
-        data = utils.prepare_csv_read(zone_file, field_names, delimiter=r'	')
-
-        for row in (x for x in data if not x['country'].startswith('#')):
-            if row['comments']:
-                row['comments'] = row['comments'].split(', ')
-            self.append(Zone(**row))
+        data = utils.prepare_read(zone_file)
+
+        for line in data:
+            # zone.tab is simple tab separated data without quoting, so the
+            # csv module isn't needed
+            line = line.rstrip('\r\n')
+            if not line or line.startswith('#'):
+                continue
+            row = line.split('	', 3)
+            country, location, zone = row[:3]
+            comments = row[3] if len(row) > 3 else None
+            if comments:
+                comments = comments.split(', ')
+            self.append(Zone(location, country, zone, comments))
 
     def dump_zone_file(self):
         """Generate a zoneinfo compatible zone description table.
@@ -27,7 +27,7 @@ import inspect
 import math
 import re
 
-from functools import reduce
+from functools import lru_cache, reduce
 
 from lxml import etree
 from lxml import objectify as _objectify
@@ -63,6 +63,16 @@ BODY_RADIUS = BODIES['Earth']
 NAUTICAL_MILE = 1.852
 #: Number of kilometres per statute mile
 STATUTE_MILE = 1.609
+#: Unit type aliases, mapped to their canonical name and size in kilometres
+_UNITS = {
+    'km': ('metric', 1),
+    'metric': ('metric', 1),
+    'sm': ('imperial', STATUTE_MILE),
+    'imperial': ('imperial', STATUTE_MILE),
+    'US customary': ('imperial', STATUTE_MILE),
+    'nm': ('nautical', NAUTICAL_MILE),
+    'nautical': ('nautical', NAUTICAL_MILE),
+}
 
 #: Maidenhead locator constants
 LONGITUDE_FIELD = 20
@@ -118,6 +128,26 @@ def value_or_empty(value):
     return value if value else ''
 
 
+@lru_cache(maxsize=128)
+def _init_arguments(cls):
+    """Find the arguments accepted by a class’s initialiser.
+
+    Introspecting a signature is far slower than formatting the values, so
+    the result is cached for each class.
+
+    Args:
+        cls (type): Class to inspect
+
+    Returns:
+        tuple of str: Argument names, excluding ``self``
+    """
+    return tuple(
+        arg
+        for arg in inspect.signature(cls.__init__).parameters
+        if arg != 'self'
+    )
+
+
 def repr_assist(obj, remap=None):
     """Helper function to simplify ``__repr__`` methods.
 
@@ -131,11 +161,8 @@ def repr_assist(obj, remap=None):
     if not remap:
         remap = {}
     data = []
-    sig = inspect.signature(obj.__class__.__init__)
-    for arg in sig.parameters:
-        if arg == 'self':
-            continue
-        elif arg in remap:
+    for arg in _init_arguments(obj.__class__):
+        if arg in remap:
             value = remap[arg]
         else:
             try:
@@ -178,6 +205,27 @@ def prepare_read(data, method='readlines', mode='r'):
     return data
 
 
+def _csv_source(data):
+    """Prepare various input types for the :mod:`csv` readers.
+
+    Args:
+        data (iter): Data to read
+
+    Returns:
+        iter: Lines suitable for parsing
+
+    Raises:
+        TypeError: Invalid value for data
+    """
+    if hasattr(data, 'readlines') or isinstance(data, list):
+        pass
+    elif isinstance(data, str):
+        data = open(data)
+    else:
+        raise TypeError('Unable to handle data of type %r' % type(data))
+    return data
+
+
 def prepare_csv_read(data, field_names, *args, **kwargs):
     """Prepare various input types for CSV parsing.
 
@@ -191,13 +239,46 @@ def prepare_csv_read(data, field_names, *args, **kwargs):
     Raises:
         TypeError: Invalid value for data
     """
-    if hasattr(data, 'readlines') or isinstance(data, list):
-        pass
+    return csv.DictReader(_csv_source(data), field_names, *args, **kwargs)
+
+
+def _prepare_csv_rows(data, *args, **kwargs):
+    """Prepare various input types for CSV parsing into lists.
+
+    Args:
+        data (iter): Data to read
+
+    Returns:
+        csv.reader: CSV reader returning each row as a list
+
+    Raises:
+        TypeError: Invalid value for data
+    """
+    return csv.reader(_csv_source(data), *args, **kwargs)
+
+
+def _xml_chunks(data, chunk_size=65536):
+    """Prepare various input types for incremental XML parsing.
+
+    Args:
+        data (iter): Data to read
+        chunk_size (int): Number of bytes to read from files at a time
+
+    Yields:
+        str or bytes: Chunks of data to feed to a parser
+
+    Raises:
+        TypeError: Invalid value for data
+    """
+    if hasattr(data, 'read'):
+        yield from iter(lambda: data.read(chunk_size), data.read(0))
+    elif isinstance(data, list):
+        yield from data
     elif isinstance(data, str):
-        data = open(data)
+        with open(data, 'rb') as f:
+            yield from iter(lambda: f.read(chunk_size), b'')
     else:
         raise TypeError('Unable to handle data of type %r' % type(data))
-    return csv.DictReader(data, field_names, *args, **kwargs)
 
 
 def prepare_xml_read(data, objectify=False):
@@ -213,17 +294,10 @@ def prepare_xml_read(data, objectify=False):
     Raises:
         TypeError: Invalid value for data
     """
-    mod = _objectify if objectify else etree
-    if hasattr(data, 'readlines'):
-        data = mod.parse(data).getroot()
-    elif isinstance(data, list):
-        data = mod.fromstring(''.join(data))
-    elif isinstance(data, str):
-        with open(data) as f:
-            data = mod.parse(f).getroot()
-    else:
-        raise TypeError('Unable to handle data of type %r' % type(data))
-    return data
+    parser = _objectify.makeparser() if objectify else etree.XMLParser()
+    for chunk in _xml_chunks(data):
+        parser.feed(chunk)
+    return parser.close()
 
 
 def element_creator(namespace=None):
@@ -282,14 +356,11 @@ def to_dms(angle, style='dms'):
     angle = abs(angle) * 3600
     minutes, seconds = divmod(angle, 60)
     degrees, minutes = divmod(minutes, 60)
+    # The components are all non-negative, so only the sign needs applying
     if style == 'dms':
-        return tuple(
-            sign * abs(i) for i in (int(degrees), int(minutes), seconds)
-        )
+        return (sign * int(degrees), sign * int(minutes), sign * seconds)
     elif style == 'dm':
-        return tuple(
-            sign * abs(i) for i in (int(degrees), (minutes + seconds / 60))
-        )
+        return (sign * int(degrees), sign * (minutes + seconds / 60))
     else:
         raise ValueError(f'Unknown style type {style!r}')
 
@@ -489,17 +560,26 @@ class Timestamp(datetime.datetime):
             Timestamp: Parsed timestamp
         """
         if len(timestamp) == 20:
-            zone = TzOffset('+00:00')
-            timestamp = timestamp[:-1]
+            zone = _tz_offset('+00:00')
         elif len(timestamp) == 24:
-            zone = TzOffset('%s:%s' % (timestamp[-5:-2], timestamp[-2:]))
-            timestamp = timestamp[:-5]
+            zone = _tz_offset('%s:%s' % (timestamp[-5:-2], timestamp[-2:]))
         elif len(timestamp) == 25:
-            zone = TzOffset(timestamp[-6:])
-            timestamp = timestamp[:-6]
-        timestamp = Timestamp.strptime(timestamp, '%Y-%m-%dT%H:%M:%S')
-        timestamp = timestamp.replace(tzinfo=zone)
-        return timestamp
+            zone = _tz_offset(timestamp[-6:])
+        # Fields are at fixed positions, so slicing them out is far quicker
+        # than parsing with strptime()
+        return Timestamp(
+            int(timestamp[:4]),
+            int(timestamp[5:7]),
+            int(timestamp[8:10]),
+            int(timestamp[11:13]),
+            int(timestamp[14:16]),
+            int(timestamp[17:19]),
+            tzinfo=zone,
+        )
+
+
+#: Shared ``TzOffset`` objects, as data files tend to use very few offsets
+_tz_offset = lru_cache(maxsize=None)(TzOffset)
 
 
 # }}}
@@ -620,22 +700,29 @@ def to_iso6709(latitude, longitude, altitude=None, format='dd', precision=4):
             )
         )
     elif format in ('dm', 'dms'):
-        if format == 'dm':
-            latitude_dms = to_dms(latitude, 'dm')
-            longitude_dms = to_dms(longitude, 'dm')
-        elif format == 'dms':
-            latitude_dms = to_dms(latitude)
-            longitude_dms = to_dms(longitude)
         latitude_sign = '-' if latitude < 0 else '+'
         longitude_sign = '-' if longitude < 0 else '+'
-        latitude_dms = tuple(abs(i) for i in latitude_dms)
-        longitude_dms = tuple(abs(i) for i in longitude_dms)
+        # Hemispheres are given by sign, so only magnitudes are needed
         if format == 'dm':
-            text.append('%s%02i%02i' % ((latitude_sign,) + latitude_dms))
-            text.append('%s%03i%02i' % ((longitude_sign,) + longitude_dms))
-        elif format == 'dms':
-            text.append('%s%02i%02i%02i' % ((latitude_sign,) + latitude_dms))
-            text.append('%s%03i%02i%02i' % ((longitude_sign,) + longitude_dms))
+            text.append(
+                '%s%02i%02i%s%03i%02i'
+                % (
+                    latitude_sign,
+                    *to_dms(abs(latitude), 'dm'),
+                    longitude_sign,
+                    *to_dms(abs(longitude), 'dm'),
+                )
+            )
+        else:
+            text.append(
+                '%s%02i%02i%02i%s%03i%02i%02i'
+                % (
+                    latitude_sign,
+                    *to_dms(abs(latitude)),
+                    longitude_sign,
+                    *to_dms(abs(longitude)),
+                )
+            )
     else:
         raise ValueError(f'Unknown format type {format!r}')
     if altitude and int(altitude) == altitude:
@@ -646,6 +733,25 @@ def to_iso6709(latitude, longitude, altitude=None, format='dd', precision=4):
     return ''.join(text)
 
 
+def _resolve_units(units):
+    """Resolve a unit type alias.
+
+    Args:
+        units (str): Unit type to be used for distances
+
+    Returns:
+        tuple of str and float: Canonical unit type name, and its size in
+            kilometres
+
+    Raises:
+        ValueError: Unknown value for ``units``
+    """
+    try:
+        return _UNITS[units]
+    except (KeyError, TypeError):
+        raise ValueError(f'Unknown units type {units!r}')
+
+
 def angle_to_distance(angle, units='metric'):
     """Convert angle in to distance along a great circle.
 
@@ -659,16 +765,8 @@ def angle_to_distance(angle, units='metric'):
     Raises:
         ValueError: Unknown value for ``units``
     """
-    distance = math.radians(angle) * BODY_RADIUS
-
-    if units in ('km', 'metric'):
-        return distance
-    elif units in ('sm', 'imperial', 'US customary'):
-        return distance / STATUTE_MILE
-    elif units in ('nm', 'nautical'):
-        return distance / NAUTICAL_MILE
-    else:
-        raise ValueError(f'Unknown units type {units!r}')
+    _, scale = _resolve_units(units)
+    return math.radians(angle) * BODY_RADIUS / scale
 
 
 def distance_to_angle(distance, units='metric'):
@@ -684,16 +782,8 @@ def distance_to_angle(distance, units='metric'):
     Raises:
         ValueError: Unknown value for ``units``
     """
-    if units in ('km', 'metric'):
-        pass
-    elif units in ('sm', 'imperial', 'US customary'):
-        distance *= STATUTE_MILE
-    elif units in ('nm', 'nautical'):
-        distance *= NAUTICAL_MILE
-    else:
-        raise ValueError(f'Unknown units type {units!r}')
-
-    return math.degrees(distance / BODY_RADIUS)
+    _, scale = _resolve_units(units)
+    return math.degrees(distance * scale / BODY_RADIUS)
 
 
 def from_grid_locator(locator):
@@ -801,44 +891,55 @@ def to_grid_locator(latitude, longitude, precision='square'):
     if not -180 <= longitude <= 180:
         raise ValueError('Invalid longitude value {longitude!r}')
 
-    latitude += 90.0
-    longitude += 180.0
+    return _grid_locator(latitude, longitude, precision)
 
-    locator = []
 
-    field = int(longitude / LONGITUDE_FIELD)
-    locator.append(chr(field + 65))
-    longitude -= field * LONGITUDE_FIELD
+def _grid_locator(latitude, longitude, precision):
+    """Calculate Maidenhead locator from validated latitude and longitude.
 
-    field = int(latitude / LATITUDE_FIELD)
-    locator.append(chr(field + 65))
-    latitude -= field * LATITUDE_FIELD
+    See also:
+        to_grid_locator
 
-    square = int(longitude / LONGITUDE_SQUARE)
-    locator.append(str(square))
-    longitude -= square * LONGITUDE_SQUARE
+    Args:
+        latitude (float): Position’s latitude
+        longitude (float): Position’s longitude
+        precision (str): Precision with which generate locator string
 
-    square = int(latitude / LATITUDE_SQUARE)
-    locator.append(str(square))
-    latitude -= square * LATITUDE_SQUARE
+    Returns:
+        str: Maidenhead locator for latitude and longitude
+    """
+    latitude += 90.0
+    longitude += 180.0
 
-    if precision in ('subsquare', 'extsquare'):
-        subsquare = int(longitude / LONGITUDE_SUBSQUARE)
-        locator.append(chr(subsquare + 97))
-        longitude -= subsquare * LONGITUDE_SUBSQUARE
+    lon_field = int(longitude / LONGITUDE_FIELD)
+    longitude -= lon_field * LONGITUDE_FIELD
+    lat_field = int(latitude / LATITUDE_FIELD)
+    latitude -= lat_field * LATITUDE_FIELD
 
-        subsquare = int(latitude / LATITUDE_SUBSQUARE)
-        locator.append(chr(subsquare + 97))
-        latitude -= subsquare * LATITUDE_SUBSQUARE
+    lon_square = int(longitude / LONGITUDE_SQUARE)
+    longitude -= lon_square * LONGITUDE_SQUARE
+    lat_square = int(latitude / LATITUDE_SQUARE)
+    latitude -= lat_square * LATITUDE_SQUARE
 
-    if precision == 'extsquare':
-        extsquare = int(longitude / LONGITUDE_EXTSQUARE)
-        locator.append(str(extsquare))
+    locator = (
+        f'{chr(lon_field + 65)}{chr(lat_field + 65)}'
+        f'{lon_square}{lat_square}'
+    )
+    if precision == 'square':
+        return locator
 
-        extsquare = int(latitude / LATITUDE_EXTSQUARE)
-        locator.append(str(extsquare))
+    lon_subsquare = int(longitude / LONGITUDE_SUBSQUARE)
+    longitude -= lon_subsquare * LONGITUDE_SUBSQUARE
+    lat_subsquare = int(latitude / LATITUDE_SUBSQUARE)
+    latitude -= lat_subsquare * LATITUDE_SUBSQUARE
 
-    return ''.join(locator)
+    locator += f'{chr(lon_subsquare + 97)}{chr(lat_subsquare + 97)}'
+    if precision == 'subsquare':
+        return locator
+
+    lon_extsquare = int(longitude / LONGITUDE_EXTSQUARE)
+    lat_extsquare = int(latitude / LATITUDE_EXTSQUARE)
+    return f'{locator}{lon_extsquare}{lat_extsquare}'
 
 
 def parse_location(location):
@@ -929,6 +1030,12 @@ ZENITH = {
     'astronomical': -18,
 }
 
+# Sun event times only have minute resolution, so share the immutable
+# objects instead of allocating one per result
+_MINUTES = tuple(
+    datetime.time(hour, minute) for hour in range(24) for minute in range(60)
+)
+
 
 def sun_rise_set(
     latitude, longitude, date, mode='rise', timezone=0, zenith=None
@@ -960,39 +1067,97 @@ def sun_rise_set(
     Raises:
         ValueError: Unknown value for ``mode``
     """
+    n, zenith = _sun_arguments(date, zenith)
+    rising = _is_sunrise(mode)
+    rad_latitude = math.radians(latitude)
+    return _sun_rise_set(
+        n,
+        longitude,
+        math.sin(rad_latitude),
+        math.cos(rad_latitude),
+        rising,
+        timezone,
+        zenith,
+    )
+
+
+def _sun_arguments(date, zenith):
+    """Resolve location independent arguments for sun event calculations.
+
+    Args:
+        date (datetime.date): Calculate events for given date, defaulting to
+            today
+        zenith (str): Calculate rise/set events, or twilight times
+
+    Returns:
+        tuple of int and float: Day of the year, and zenith angle in radians
+    """
     if not date:
         date = datetime.date.today()
 
-    zenith = ZENITH[zenith]
+    zenith = math.radians(ZENITH[zenith])
 
     # First calculate the day of the year
     # Thanks, datetime this would have been ugly without you!!!
     n = (date - datetime.date(date.year - 1, 12, 31)).days
+    return n, zenith
+
+
+def _is_sunrise(mode):
+    """Check sun event mode.
+
+    Args:
+        mode (str): Which time to calculate
 
+    Returns:
+        bool: Whether the event is a sunrise
+
+    Raises:
+        ValueError: Unknown value for ``mode``
+    """
+    if mode not in ('rise', 'set'):
+        raise ValueError(f'Unknown mode value {mode!r}')
+    return mode == 'rise'
+
+
+def _sun_rise_set(n, longitude, sin_lat, cos_lat, rising, timezone, zenith):
+    """Calculate sunrise or sunset from pre-computed values.
+
+    See also:
+        sun_rise_set
+
+    Args:
+        n (int): Day of the year
+        longitude (float): Location’s longitude
+        sin_lat (float): Sine of the location’s latitude
+        cos_lat (float): Cosine of the location’s latitude
+        rising (bool): Calculate sunrise if true, and sunset otherwise
+        timezone (int): Offset from UTC in minutes
+        zenith (float): Sun’s zenith angle for the event in radians
+
+    Returns:
+        datetime.time or None: The time for the given event in the specified
+            timezone, or ``None`` if the event doesn't occur on the given date
+    """
     # Convert the longitude to hour value and calculate an approximate time
     lng_hour = longitude / 15
 
-    if mode == 'rise':
+    if rising:
         t = n + ((6 - lng_hour) / 24)
-    elif mode == 'set':
-        t = n + ((18 - lng_hour) / 24)
     else:
-        raise ValueError(f'Unknown mode value {mode!r}')
+        t = n + ((18 - lng_hour) / 24)
 
     # Calculate the Sun’s mean anomaly
     m = (0.9856 * t) - 3.289
 
     # Calculate the Sun’s true longitude
-    l = (
-        m
-        + 1.916 * math.sin(math.radians(m))
-        + 0.020 * math.sin(2 * math.radians(m))
-        + 282.634
-    )
+    rad_m = math.radians(m)
+    l = m + 1.916 * math.sin(rad_m) + 0.020 * math.sin(2 * rad_m) + 282.634
     l = abs(l) % 360
+    rad_l = math.radians(l)
 
     # Calculate the Sun’s right ascension
-    ra = math.degrees(math.atan(0.91764 * math.tan(math.radians(l))))
+    ra = math.degrees(math.atan(0.91764 * math.tan(rad_l)))
 
     # Right ascension value needs to be in the same quadrant as L
     l_quandrant = (math.floor(l / 90)) * 90
@@ -1003,23 +1168,20 @@ def sun_rise_set(
     ra = ra / 15
 
     # Calculate the Sun’s declination
-    sin_dec = 0.39782 * math.sin(math.radians(l))
-    cos_dec = math.cos(math.asin(sin_dec))
+    sin_dec = 0.39782 * math.sin(rad_l)
+    # Declination is within ±24°, so its cosine is always positive
+    cos_dec = math.sqrt(1 - sin_dec * sin_dec)
 
     # Calculate the Sun’s local hour angle
-    cos_h = (
-        math.radians(zenith) - (sin_dec * math.sin(math.radians(latitude)))
-    ) / (cos_dec * math.cos(math.radians(latitude)))
+    cos_h = (zenith - (sin_dec * sin_lat)) / (cos_dec * cos_lat)
 
-    if cos_h > 1:
-        # The sun never rises on this location (on the specified date)
-        return None
-    elif cos_h < -1:
-        # The sun never sets on this location (on the specified date)
+    if not -1 <= cos_h <= 1:
+        # The sun never rises, or never sets, on this location (on the
+        # specified date)
         return None
 
     # Finish calculating H and convert into hours
-    if mode == 'rise':
+    if rising:
         h = 360 - math.degrees(math.acos(cos_h))
     else:
         h = math.degrees(math.acos(cos_h))
@@ -1045,7 +1207,10 @@ def sun_rise_set(
         minute = int(60 * (local_t % hour))
     if minute < 0:
         minute += 60
-    return datetime.time(hour, minute)
+    if not 0 <= hour < 24:
+        # Let datetime raise its usual error for out of range values
+        return datetime.time(hour, minute)
+    return _MINUTES[hour * 60 + minute]
 
 
 def sun_events(latitude, longitude, date, timezone=0, zenith=None):
@@ -1067,13 +1232,43 @@ def sun_events(latitude, longitude, date, timezone=0, zenith=None):
         timezone (int): Offset from UTC in minutes
         zenith (str): Calculate rise/set events, or twilight times
 
+    Returns:
+        tuple of datetime.time: The time for the given events in the specified
+            timezone
+    """
+    n, zenith = _sun_arguments(date, zenith)
+    rad_latitude = math.radians(latitude)
+    return _sun_events(
+        n,
+        longitude,
+        math.sin(rad_latitude),
+        math.cos(rad_latitude),
+        timezone,
+        zenith,
+    )
+
+
+def _sun_events(n, longitude, sin_lat, cos_lat, timezone, zenith):
+    """Calculate sunrise and sunset from pre-computed values.
+
+    See also:
+        sun_events
+
+    Args:
+        n (int): Day of the year
+        longitude (float): Location’s longitude
+        sin_lat (float): Sine of the location’s latitude
+        cos_lat (float): Cosine of the location’s latitude
+        timezone (int): Offset from UTC in minutes
+        zenith (float): Sun’s zenith angle for the events in radians
+
     Returns:
         tuple of datetime.time: The time for the given events in the specified
             timezone
     """
     return (
-        sun_rise_set(latitude, longitude, date, 'rise', timezone, zenith),
-        sun_rise_set(latitude, longitude, date, 'set', timezone, zenith),
+        _sun_rise_set(n, longitude, sin_lat, cos_lat, True, timezone, zenith),
+        _sun_rise_set(n, longitude, sin_lat, cos_lat, False, timezone, zenith),
     )
 
 